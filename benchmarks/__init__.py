@@ -0,0 +1 @@
+"""Benchmarks for the validation pipeline, run against synthetic voterfiles."""
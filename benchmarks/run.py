@@ -0,0 +1,159 @@
+"""
+Times each stage of the validation pipeline over synthetic voterfiles and writes records/sec and
+peak memory per stage to a JSON file, so runs can be compared between versions.
+
+`stage_peak_mb` is the peak Python memory allocated while the stage runs, measured with tracemalloc in a
+second, untimed pass so tracing does not slow the timed one. `process_max_rss_mb` is the process's peak RSS
+when the stage finishes, which is cumulative: a stage that stays below an earlier peak reports that peak.
+
+Usage:
+    python -m benchmarks.run --toml path/to/statewide.toml --state texas --sizes 1000 10000 --error-rate 0.2
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from sqlmodel import SQLModel, create_engine
+
+from vep_validation_tools.create_validator import CreateValidator, CreateRecords
+from vep_validation_tools.funcs import VEPKeyMaker
+from vep_validation_tools.pydantic_models.record import RecordBaseModel
+from vep_validation_tools.pydantic_models.rename_model import create_renamed_model
+
+from .synthetic import SyntheticVoterfile
+
+
+@dataclass
+class StageResult:
+    records: int
+    seconds: float
+    records_per_sec: float
+    stage_peak_mb: float
+    process_max_rss_mb: float
+
+
+def process_max_rss_mb() -> float:
+    _max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return _max_rss / (1024 * 1024) if sys.platform == 'darwin' else _max_rss / 1024
+
+
+def traced_peak_mb(func: Callable[[], Any]) -> float:
+    """The peak memory allocated by `func` above what was allocated when it started."""
+    tracemalloc.start()
+    try:
+        _start = tracemalloc.get_traced_memory()[0]
+        func()
+        return (tracemalloc.get_traced_memory()[1] - _start) / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def stage_result(records: int, seconds: float, peak_mb: float) -> StageResult:
+    return StageResult(
+        records=records,
+        seconds=round(seconds, 6),
+        records_per_sec=round(records / seconds, 2) if seconds else 0.0,
+        stage_peak_mb=round(peak_mb, 2),
+        process_max_rss_mb=round(process_max_rss_mb(), 2),
+    )
+
+
+def time_stage(func: Callable[[Any], Any], items: Iterable[Any]) -> Tuple[StageResult, List[Any]]:
+    _items = list(items)
+    _start = time.perf_counter()
+    outputs = [func(item) for item in _items]
+    _seconds = time.perf_counter() - _start
+    _peak_mb = traced_peak_mb(lambda: [func(item) for item in _items])
+    return stage_result(len(_items), _seconds, _peak_mb), outputs
+
+
+def load_records(records: List[Any]) -> float:
+    """Loads `records` into a fresh SQLite database, returning the seconds taken."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'benchmark.db'}")
+        SQLModel.metadata.create_all(engine)
+        _loader = CreateRecords(engine=engine)
+        _start = time.perf_counter()
+        _loader.create_db_records(records)
+        _seconds = time.perf_counter() - _start
+        engine.dispose()
+    return _seconds
+
+
+def run_benchmark(field_path: Path, state: str, size: int, error_rate: float, seed: int = 0) -> Dict[str, Any]:
+    validator = CreateValidator(
+        state_name=(state, 'voterfile'),
+        renaming_validator=create_renamed_model(state, field_path),
+        record_validator=RecordBaseModel,
+        field_path=field_path
+    )
+    records = list(SyntheticVoterfile(field_path, state, error_rate=error_rate, seed=seed).records(size))
+    stages: Dict[str, StageResult] = {}
+
+    stages['rename'], renamed = time_stage(validator.renaming_validator._validate, records)
+    _renamed = [result for status, result in renamed if status == 'valid']
+
+    def _cleanup(renamed_record):
+        return validator.cleanup_validator._validate({**dict(renamed_record), 'data': renamed_record})
+
+    stages['cleanup'], cleaned = time_stage(_cleanup, _renamed)
+    _cleaned = [result for status, result in cleaned if status == 'valid']
+
+    stages['vep_keys'], _ = time_stage(VEPKeyMaker.create_vep_keys, _cleaned)
+
+    _seconds = load_records(_cleaned)
+    # Loaded models stay bound to their session, so the traced load gets a fresh copy of the records.
+    _fresh = [result for status, result in map(_cleanup, _renamed) if status == 'valid']
+    for record in _fresh:
+        VEPKeyMaker.create_vep_keys(record)
+    stages['create_db_records'] = stage_result(len(_cleaned), _seconds, traced_peak_mb(lambda: load_records(_fresh)))
+    return {
+        'size': size,
+        'error_rate': error_rate,
+        'valid': len(_cleaned),
+        'stages': {k: asdict(v) for k, v in stages.items()},
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--toml', type=Path, required=True, help="State TOML field layout")
+    parser.add_argument('--state', required=True, help="State name used to read the TOML file")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--error-rate', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=Path('bench_output.json'))
+    args = parser.parse_args(argv)
+
+    try:
+        _version = version('vep-validation-tools')
+    except PackageNotFoundError:
+        _version = None
+
+    report = {
+        'version': _version,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'state': args.state,
+        'toml': str(args.toml),
+        'results': [run_benchmark(args.toml, args.state, size, args.error_rate, args.seed) for size in args.sizes],
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    print(json.dumps(report['results'], indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+from __future__ import annotations
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional
+
+from vep_validation_tools.utils.readers import TomlReader
+
+FIRST_NAMES = ['JAMES', 'MARY', 'ROBERT', 'PATRICIA', 'JOHN', 'JENNIFER', 'MICHAEL', 'LINDA', 'DAVID', 'MARIA',
+               'JOSE', 'ELIZABETH', 'WILLIAM', 'SUSAN', 'DANIEL', 'JESSICA', 'CARLOS', 'SARAH', 'NGUYEN', 'KAREN']
+LAST_NAMES = ['SMITH', 'JOHNSON', 'WILLIAMS', 'BROWN', 'JONES', 'GARCIA', 'MILLER', 'DAVIS', 'RODRIGUEZ',
+              'MARTINEZ', 'HERNANDEZ', 'LOPEZ', 'GONZALEZ', 'WILSON', 'ANDERSON', 'THOMAS', 'TAYLOR', 'MOORE']
+STREET_NAMES = ['MAIN', 'OAK', 'PINE', 'MAPLE', 'CEDAR', 'ELM', 'WASHINGTON', 'LAKE', 'HILL', 'PARK', 'SPRING',
+                'RIVER', 'SUNSET', 'LINCOLN', 'JACKSON', 'MILL', 'CHURCH', 'MEADOW', 'FOREST', 'RIDGE']
+STREET_TYPES = ['ST', 'AVE', 'RD', 'DR', 'LN', 'BLVD', 'CT', 'WAY', 'PL', 'TRL']
+DIRECTIONALS = ['N', 'S', 'E', 'W']
+UNIT_TYPES = ['APT', 'UNIT', 'STE']
+CITIES = [('AUSTIN', '787'), ('HOUSTON', '770'), ('DALLAS', '752'), ('SAN ANTONIO', '782'), ('EL PASO', '799'),
+          ('FORT WORTH', '761'), ('ARLINGTON', '760'), ('PLANO', '750'), ('LUBBOCK', '794'), ('LAREDO', '780')]
+AREA_CODES = ['512', '713', '214', '210', '915', '817', '469', '806', '956', '281']
+VOTE_METHODS = ['E', 'A', 'M', 'P']
+STATUSES = ['ACTIVE', 'SUSPENSE', 'INACTIVE']
+PARTIES = ['DEM', 'REP', 'LIB', 'GRN', 'NON']
+
+
+@dataclass
+class SyntheticVoterfile:
+    """
+    Generates synthetic voterfile records that match a state's TOML `FIELDS` layout.
+
+    Each record is keyed by the input column names of the layout (the first alias of every mapped field)
+    and filled with realistic names, DOBs, addresses, phones, districts, registration and vote history
+    values. A share of `error_rate` records is broken on purpose, by blanking the name or the addresses,
+    so invalid paths are exercised too.
+
+    Attributes:
+        field_path (Path): The state TOML file.
+        state (str): The state name the TOML file is read under.
+        error_rate (float): The share of records that should fail validation.
+        seed (Optional[int]): Seed for reproducible files.
+        households (int): Records share addresses with this many others on average, as in a real voterfile.
+    """
+    field_path: Path
+    state: str
+    error_rate: float = 0.1
+    seed: Optional[int] = 0
+    households: int = 3
+    _columns: Dict[str, str] = field(default_factory=dict, init=False)
+    _date_format: str = field(default='%Y%m%d', init=False)
+    _state_abbreviation: str = field(default='TX', init=False)
+    _random: random.Random = field(init=False)
+
+    def __post_init__(self):
+        _toml = TomlReader(file=Path(self.field_path), name=self.state.lower()).data
+        _settings = _toml.get('SETTINGS', {})
+        _date_format = _settings.get('FIELD-FORMATTING', {}).get('date') or self._date_format
+        self._date_format = _date_format[0] if isinstance(_date_format, list) else _date_format
+        self._state_abbreviation = (_settings.get('STATE') or {}).get('abbreviation') or self._state_abbreviation
+        for target, source in _toml.get('FIELDS', {}).items():
+            if isinstance(source, list):
+                source = next((x for x in source if x), None)
+            self._columns[target] = target if source in (None, 'null') else source
+        self._random = random.Random(self.seed)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns.values())
+
+    def _address(self) -> Dict[str, str]:
+        r = self._random
+        city, zip3 = r.choice(CITIES)
+        return {
+            'number': str(r.randint(100, 99999)),
+            'street_pre_directional': r.choice(DIRECTIONALS) if r.random() < 0.2 else '',
+            'street_name': r.choice(STREET_NAMES),
+            'street_type': r.choice(STREET_TYPES),
+            'unit_type': (unit_type := r.choice(UNIT_TYPES) if r.random() < 0.15 else ''),
+            'unit_num': str(r.randint(1, 400)) if unit_type else '',
+            'city': city,
+            'state': self._state_abbreviation,
+            'zip5': f"{zip3}{r.randint(0, 99):02d}",
+            'zip4': f"{r.randint(0, 9999):04d}" if r.random() < 0.5 else '',
+        }
+
+    @staticmethod
+    def _address_value(target: str, prefix: str, address: Dict[str, str]) -> str:
+        _name = target.removeprefix(f"{prefix}_").removeprefix('part_')
+        if _name in address:
+            return address[_name]
+        if _name in ('address1', 'address_line_1', 'street', 'street_address'):
+            _line = [address['number'], address['street_pre_directional'], address['street_name'],
+                     address['street_type']]
+            return " ".join(x for x in _line if x)
+        if _name in ('address2', 'address_line_2', 'unit'):
+            return " ".join(x for x in [address['unit_type'], address['unit_num']] if x)
+        if _name in ('zip', 'zipcode', 'postal_code'):
+            return address['zip5']
+        return ''
+
+    def _value(self, target: str, row: int, person: Dict[str, Any], addresses: Dict[str, Dict[str, str]]) -> str:
+        r = self._random
+        if target.startswith(('residence', 'mail')):
+            _prefix = target.split('_')[0]
+            return self._address_value(target, _prefix, addresses[_prefix])
+        if target.startswith('person'):
+            if target.endswith('first'):
+                return person['first']
+            if target.endswith('last'):
+                return person['last']
+            if target.endswith('middle'):
+                return r.choice(FIRST_NAMES)[0]
+            if target.endswith('suffix'):
+                return r.choice(['JR', 'SR', 'III']) if r.random() < 0.05 else ''
+            if target.endswith('gender'):
+                return r.choice(['M', 'F', 'U'])
+            if 'dob' in target:
+                _dob: date = person['dob']
+                return {
+                    'person_dob': _dob.strftime(self._date_format),
+                    'person_dob_yearmonth': _dob.strftime('%Y%m'),
+                    'person_dob_year': _dob.strftime('%Y'),
+                    'person_dob_month': _dob.strftime('%m'),
+                    'person_dob_day': _dob.strftime('%d'),
+                }.get(target, _dob.strftime(self._date_format))
+            return ''
+        if target.startswith('voter'):
+            if target.endswith('vuid'):
+                return str(1_000_000_000 + row)
+            if 'registration_date' in target:
+                return (person['dob'] + timedelta(days=r.randint(18 * 365, 50 * 365))).strftime(self._date_format)
+            if target.endswith('status'):
+                return r.choice(STATUSES)
+            if target.endswith('party'):
+                return r.choice(PARTIES)
+            if 'precinct' in target:
+                return str(r.randint(1, 500))
+            return ''
+        if target.startswith('contact_phone'):
+            _area, _number = r.choice(AREA_CODES), f"{r.randint(200, 999)}{r.randint(0, 9999):04d}"
+            if target.endswith('areacode'):
+                return _area
+            if target.endswith('number'):
+                return _number
+            return f"{_area}{_number}" if r.random() < 0.6 else ''
+        if target.startswith('district'):
+            return str(r.randint(1, 38))
+        if target.startswith(('election', 'vote')):
+            return r.choice(VOTE_METHODS) if r.random() < 0.4 else ''
+        return ''
+
+    def records(self, size: int, file_origin: str = 'synthetic.csv') -> Generator[Dict[str, Any], None, None]:
+        r = self._random
+        _household: Dict[str, Dict[str, str]] = {}
+        for row in range(size):
+            if not _household or r.random() > 1 - 1 / self.households:
+                _household = {'residence': self._address(), 'mail': self._address()}
+                _household['mail'] = _household['residence'] if r.random() < 0.8 else _household['mail']
+            person = {
+                'first': r.choice(FIRST_NAMES),
+                'last': r.choice(LAST_NAMES),
+                'dob': date(1940, 1, 1) + timedelta(days=r.randint(0, 365 * 65)),
+            }
+            record = {
+                source: self._value(target, row, person, _household) for target, source in self._columns.items()
+            }
+            if r.random() < self.error_rate:
+                # Break the record the way junk vendor rows usually are broken.
+                _broken = ('person', 'voter') if r.random() < 0.5 else ('residence', 'mail')
+                for target, source in self._columns.items():
+                    if target.startswith(_broken):
+                        record[source] = ''
+            record['file_origin'] = file_origin
+            yield record
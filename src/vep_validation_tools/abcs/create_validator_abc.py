@@ -1,16 +1,20 @@
 from __future__ import annotations
 import abc
-from typing import Optional, Annotated, Dict, Any, List, Tuple, Iterable, Type, Generator
+import io
+from typing import Optional, Annotated, Dict, Any, List, Tuple, Iterable, Type, Generator, Callable, IO
 import uuid
-from datetime import datetime
+import queue
+import heapq
 import itertools
-from collections import Counter
+from datetime import datetime
 from dataclasses import dataclass, field
 
 import pandas as pd
 from pydantic import ValidationError, BaseModel, Field as PydanticField
 from sqlmodel import SQLModel
 
+from ..utils.error_aggregator import ErrorAggregator
+
 
 InputRecords = Iterable[Dict[str, Any]] | Generator[Dict[str, Any], None, None] | Dict[str, Any]
 PassedRecords = Iterable[SQLModel] | Generator[SQLModel, None, None]
@@ -20,6 +24,8 @@ ValidationResults = Tuple[PassedRecords, InvalidRecords]
 ValidatorOutput = Tuple[str, SQLModel | Dict[str, Any]]
 RunValidationOutput = Generator[ValidatorOutput, None, None]
 
+ValidationSink = Callable[[Any], Any] | queue.Queue | IO
+
 
 class RecordErrorValidator(BaseModel):
     error_id: uuid.uuid4 = PydanticField(default_factory=uuid.uuid4)
@@ -34,11 +40,107 @@ class ErrorDetails(BaseModel):
     errors: Annotated[List[dict], PydanticField(default_factory=list)]
 
 
+@dataclass
+class ValidationBatch:
+    """
+    Columnar result of validating a chunk of records: the valid models with their row indices, and parallel
+    arrays of row index, error code and stage for every invalid row.
+    """
+    valid: List[SQLModel] = field(default_factory=list)
+    valid_indices: List[int] = field(default_factory=list)
+    invalid_indices: List[int] = field(default_factory=list)
+    error_codes: List[Optional[str]] = field(default_factory=list)
+    stages: List[str] = field(default_factory=list)
+    errors: List[ErrorDetails] = field(default_factory=list)
+
+    def __len__(self):
+        return len(self.valid_indices) + len(self.invalid_indices)
+
+    def add(self, index: int, status: str, result: SQLModel | ErrorDetails) -> None:
+        if status == 'valid':
+            self.valid.append(result)
+            self.valid_indices.append(index)
+        else:
+            self.invalid_indices.append(index)
+            self.error_codes.append(result.errors[0]['type'] if result.errors else None)
+            self.stages.append(result.point_of_failure)
+            self.errors.append(result)
+
+    def results(self) -> RunValidationOutput:
+        """Yields the batch back as `(status, result)` tuples in input order."""
+        _valid = zip(self.valid_indices, itertools.repeat('valid'), self.valid)
+        _invalid = zip(self.invalid_indices, itertools.repeat('invalid'), self.errors)
+        for _, status, result in heapq.merge(_valid, _invalid, key=lambda x: x[0]):
+            yield status, result
+
+    def errors_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            'row': self.invalid_indices,
+            'stage': self.stages,
+            'error_code': self.error_codes,
+        })
+
+
+@dataclass
+class ValidationRouter:
+    """
+    Dispatches every result of a validation pipeline to the sinks registered for its status in a single
+    pass, so the results of one status are never buffered while the other status is being consumed.
+
+    A sink is a callable, a `queue.Queue` (results are `put` on it) or a text or binary writer, which receives
+    each result as a line of JSON.
+    """
+    _sinks: Dict[str, List[Callable[[Any], Any]]] = field(
+        default_factory=lambda: {'valid': [], 'invalid': []},
+        init=False
+    )
+
+    def add_sink(self, status: str, sink: ValidationSink) -> None:
+        if status not in self._sinks:
+            raise ValueError("status must be either 'valid' or 'invalid'")
+        if callable(sink):
+            _sink = sink
+        elif isinstance(sink, queue.Queue):
+            _sink = sink.put
+        elif hasattr(sink, 'write'):
+            _sink = self._json_lines(sink)
+        else:
+            raise TypeError(f"Unsupported sink type: {type(sink)}")
+        self._sinks[status].append(_sink)
+
+    @staticmethod
+    def _json_lines(writer: IO) -> Callable[[BaseModel], None]:
+        _binary = isinstance(writer, (io.RawIOBase, io.BufferedIOBase))
+
+        def write(result: BaseModel) -> None:
+            # Pydantic errors carry the raised exception in `ctx`, which is written as its message.
+            _line = result.model_dump_json(fallback=str) + "\n"
+            writer.write(_line.encode('utf-8') if _binary else _line)
+        return write
+
+    def dispatch(self, status: str, result: Any) -> None:
+        for sink in self._sinks[status]:
+            sink(result)
+
+    def route(self, pipeline: RunValidationOutput) -> None:
+        for status, result in pipeline:
+            self.dispatch(status, result)
+
+    def select(self, pipeline: RunValidationOutput, status: str) -> Generator[Any, None, None]:
+        """Yields the results matching `status`, dispatching every result to the registered sinks on the way."""
+        for _status, result in pipeline:
+            self.dispatch(_status, result)
+            if _status == status:
+                yield result
+
+
 @dataclass
 class CreateValidatorABC(abc.ABC):
     state_name: Tuple[str, str]
     validator: SQLModel
     errors: Optional[pd.DataFrame] = field(default=None)
+    router: ValidationRouter = field(default_factory=ValidationRouter, init=False)
+    error_aggregator: ErrorAggregator = field(default_factory=ErrorAggregator, init=False)
     _records: Optional[InputRecords] = field(default=None, init=False)
     _validation_generator: Optional[RunValidationOutput] = field(default=None, init=False)
     _valid_count: int = field(default=0, init=False)
@@ -47,17 +149,29 @@ class CreateValidatorABC(abc.ABC):
     def __repr__(self):
         return f"Validation Model: {self.validator.__name__}"
 
-    def validate_single_record(self, record: InputRecords) -> RunValidationOutput:
+    def add_sink(self, status: str, sink: ValidationSink) -> None:
+        self.router.add_sink(status, sink)
+
+    def _validate(self, record: Dict[str, Any]) -> ValidatorOutput:
         try:
             validated = self.validator.model_validate(record)
-            yield 'valid', validated
+            return 'valid', validated
         except ValidationError as e:
             error_detail = ErrorDetails(
                 model=self.validator.__name__,
                 point_of_failure=self.validator.__name__,
                 errors=e.errors()
                 )
-            yield 'invalid', error_detail
+            return 'invalid', error_detail
+
+    def validate_single_record(self, record: InputRecords) -> RunValidationOutput:
+        yield self._validate(record)
+
+    def validate_batch(self, records: List[Dict[str, Any]]) -> ValidationBatch:
+        batch = ValidationBatch()
+        for i, record in enumerate(records):
+            batch.add(i, *self._validate(record))
+        return batch
 
     def run_validation(self, records: InputRecords) -> None:
         self._records = records
@@ -68,26 +182,35 @@ class CreateValidatorABC(abc.ABC):
             raise ValueError("run_validation must be called before creating the validation generator")
 
         for record in self._records:
-            status, result = self.validate_single_record(record)
+            status, result = self._validate(record)
             if status == 'valid':
                 self._valid_count += 1
             else:
                 self._invalid_count += 1
+                self.error_aggregator.add(result)
             yield status, result
 
     @property
     def valid(self) -> PassedRecords:
+        """
+        Valid results, read in the same pass as the invalid ones. Invalid results are only kept by the
+        sinks registered for them, so consuming `valid` first does not buffer them.
+        """
         if self._validation_generator is None:
             raise ValueError("run_validation must be called before accessing valid records")
-        valid_gen, self._validation_generator = itertools.tee(self._validation_generator)
-        return (result for status, result in valid_gen if status == 'valid')
+        return self.router.select(self._validation_generator, 'valid')
 
     @property
     def invalid(self) -> InvalidRecords:
         if self._validation_generator is None:
             raise ValueError("run_validation must be called before accessing invalid records")
-        invalid_gen, self._validation_generator = itertools.tee(self._validation_generator)
-        return (result for status, result in invalid_gen if status == 'invalid')
+        return self.router.select(self._validation_generator, 'invalid')
+
+    def route(self) -> None:
+        """Runs the whole validation in one pass, sending every result to the registered sinks."""
+        if self._validation_generator is None:
+            raise ValueError("run_validation must be called before routing records")
+        self.router.route(self._validation_generator)
 
     @property
     def valid_count(self) -> int:
@@ -98,9 +221,9 @@ class CreateValidatorABC(abc.ABC):
         return self._invalid_count
 
     def get_errors(self) -> pd.DataFrame:
-        errors = list(self.invalid)
+        """Error counts by type for the records validated so far, without re-reading the invalid records."""
         self.errors = pd.DataFrame.from_dict(
-            Counter(error['error_type'] for error in errors),
+            self.error_aggregator.summary(),
             orient="index",
             columns=["count"],
         )
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 import abc
-from ..utils.readers import TomlReader
+from ..utils.readers import load_state_config
+from ..utils.readers.state_config import fixed_width_layout
 from typing import Any, Dict
 from pathlib import Path
 
@@ -12,15 +13,16 @@ class TomlFileFieldsABC(abc.ABC):
     _fields: Dict[str, Any] = None
 
     def __post_init__(self):
-        self.SETTINGS = self.fields.get('SETTINGS')
-        self.FIELD_FORMATTING = self.fields.get('SETTINGS').get('FIELD-FORMATTING')
-        self.VOTER_ID_LENGTHS = self.fields.get('SETTINGS').get('VOTER-ID')
-        self.REPLACE_TEXT = self.fields.get('SETTINGS').get('REPLACE-CHARS')
-        self.FIELDS = self.fields.get('FIELDS')
+        _fields = self.fields
+        self.SETTINGS = _fields.get('SETTINGS')
+        self.FIELD_FORMATTING = self.SETTINGS.get('FIELD-FORMATTING')
+        self.VOTER_ID_LENGTHS = self.SETTINGS.get('VOTER-ID')
+        self.REPLACE_TEXT = self.SETTINGS.get('REPLACE-CHARS')
+        self.FIELDS = _fields.get('FIELDS')
+        self.FIXED_WIDTH = fixed_width_layout(_fields.get('FIXED-WIDTH'))
 
     @property
     @abc.abstractmethod
     def fields(self) -> Dict[str, Any]:
-        _field_toml = TomlReader(file=self._field_path, name=self._state.lower()).data
-        self._fields = _field_toml
+        self._fields = load_state_config(self._field_path).data
         return self._fields
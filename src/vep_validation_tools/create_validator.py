@@ -1,6 +1,16 @@
 from dataclasses import field, dataclass
-from typing import Tuple, Iterable, Dict, Any, Optional, Generator
-
+from typing import (
+    Tuple, Iterable, Dict, Any, Optional, Generator, List, Type, AsyncIterable, AsyncGenerator, FrozenSet, IO
+)
+from concurrent.futures import ProcessPoolExecutor, Executor, Future
+import asyncio
+import multiprocessing
+import queue
+from collections import OrderedDict, deque
+from pathlib import Path
+import itertools
+
+import pandas as pd
 from sqlmodel import SQLModel, Relationship, Field as SQLModelField, Session, select
 from sqlalchemy import Engine
 from sqlalchemy.exc import IntegrityError
@@ -8,9 +18,13 @@ from sqlalchemy.exc import IntegrityError
 from .abcs.create_validator_abc import (
     CreateValidatorABC,
     RunValidationOutput,
+    ValidatorOutput,
+    ValidationRouter,
+    ValidationSink,
+    ValidationBatch,
     ErrorDetails
 )
-from .pydantic_models.rename_model import RecordRenamer
+from .pydantic_models.rename_model import RecordRenamer, RenamePlan, create_renamed_model
 from .pydantic_models.cleanup_model import (
     PreValidationCleanUp,
     PersonName,
@@ -31,10 +45,59 @@ from .pydantic_models.cleanup_model import (
     ElectionTurnoutCalculator
 )
 from .pydantic_models.record import RecordBaseModel
+from .funcs.record_prefilter import RecordPreFilter
+from .utils.address_cache import ADDRESS_CACHE, AddressCache
+from .utils.zip_index import ZIP_INDEX, ZipIndex, default_zip_index
+from .utils.checkpoint import ValidationCheckpoint
+from .utils.sharding import Shard, ShardResult, check_shard, shard_records, write_election_vote
+from .utils.error_aggregator import ErrorAggregator
+from .utils.instrumentation import PROFILER
+from .utils.provenance import PROVENANCE_MODE, ProvenanceMode
+from .utils.renamer_funcs import BLANKS_NORMALIZED
+from .utils.readers import PartitionedSource
 
 
+@dataclass
 class RecordRenameValidator(CreateValidatorABC):
+    """
+    Renames records through a `RenamePlan` resolved once per distinct header, falling back to full pydantic
+    validation for records the plan cannot handle, so failures are reported exactly as before.
+
+    Plans are keyed by the set of columns, whatever their order, and only the `max_plans` most recently used
+    are kept, so inputs whose records carry varying keys cannot grow the cache without bound. Records that
+    follow with the same header reuse the last plan after a tuple comparison of their keys, which short-circuits
+    on the key objects readers share between records, so no set is built per row.
+    """
     validator: RecordRenamer
+    use_plan: bool = True
+    max_plans: int = 128
+    _plans: OrderedDict[FrozenSet[str], RenamePlan] = field(default_factory=OrderedDict, init=False)
+    _current: Optional[Tuple[Tuple[str, ...], RenamePlan]] = field(default=None, init=False)
+
+    def plan(self, columns: Iterable[str]) -> RenamePlan:
+        _columns = tuple(columns)
+        _key = frozenset(_columns)
+        if (_plan := self._plans.get(_key)) is not None:
+            self._plans.move_to_end(_key)
+            return _plan
+        _plan = self._plans[_key] = RenamePlan(self.validator, _columns)
+        if len(self._plans) > self.max_plans:
+            self._plans.popitem(last=False)
+        return _plan
+
+    def _record_plan(self, record: Dict[str, Any]) -> RenamePlan:
+        _columns = tuple(record)
+        # Tuple equality compares the lengths, then each key by identity before equality.
+        if (_current := self._current) is not None and _columns == _current[0]:
+            return _current[1]
+        _plan = self.plan(_columns)
+        self._current = (_columns, _plan)
+        return _plan
+
+    def _validate(self, record: Dict[str, Any]) -> ValidatorOutput:
+        if self.use_plan and (_renamed := self._record_plan(record).rename(record)) is not None:
+            return 'valid', _renamed
+        return super()._validate(record)
 
 
 class CleanUpRecordValidator(CreateValidatorABC):
@@ -45,6 +108,65 @@ class FinalValidation(CreateValidatorABC):
     validator: RecordBaseModel
 
 
+_WORKER_VALIDATOR: Optional["CreateValidator"] = None
+
+
+def _init_validation_worker(
+        state_name: Tuple[str, str],
+        field_path: Path,
+        record_validator: Type[RecordBaseModel],
+        cleanup_validator: Type[PreValidationCleanUp],
+        prefilter: Optional[RecordPreFilter],
+        use_rename_plan: bool,
+        provenance: ProvenanceMode,
+        blanks_normalized: bool,
+        address_cache: Optional[AddressCache],
+        zip_index: Optional[ZipIndex]) -> None:
+    """Builds the renamer and cleanup validators once per worker process."""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = CreateValidator(
+        state_name=state_name,
+        renaming_validator=create_renamed_model(state_name[0], field_path),
+        record_validator=record_validator,
+        cleanup_validator=cleanup_validator,
+        field_path=field_path,
+        prefilter=prefilter,
+        use_rename_plan=use_rename_plan,
+        provenance=provenance,
+        address_cache=address_cache,
+        zip_index=zip_index
+    )
+    _WORKER_VALIDATOR._blanks_normalized = blanks_normalized
+
+
+def _validate_chunk(records: Tuple[Dict[str, Any], ...]) -> ValidationBatch:
+    return _WORKER_VALIDATOR.validate_batch(list(records))
+
+
+def _validate_partition(partition: Iterable[Dict[str, Any]], chunk_size: int, results: queue.Queue) -> None:
+    """
+    Reads and validates a partition inside the worker, so its records never pass through the parent. Results
+    are sent back through `results` one `ValidationBatch` of `chunk_size` records at a time, then None.
+    """
+    for chunk in itertools.batched(partition, chunk_size):
+        results.put(_WORKER_VALIDATOR.validate_batch(chunk))
+    results.put(None)
+
+
+def _partition_results(future: Future, results: queue.Queue) -> Generator[ValidatorOutput, None, None]:
+    while True:
+        try:
+            batch = results.get(timeout=1)
+        except queue.Empty:
+            if future.done():
+                # Re-raises a failure while reading or validating the partition, which never sends None.
+                future.result()
+            continue
+        if batch is None:
+            return
+        yield from batch.results()
+
+
 # @dataclass
 # class CreateValidator:
 #     state_name: Tuple[str, str]
@@ -132,12 +254,34 @@ class CreateValidator:
     renaming_validator: RecordRenamer | RecordRenameValidator
     record_validator: RecordBaseModel | FinalValidation
     cleanup_validator: PreValidationCleanUp | CleanUpRecordValidator = field(default=PreValidationCleanUp)
+    field_path: Optional[Path] = None
+    prefilter: Optional[RecordPreFilter] = None
+    use_rename_plan: bool = True
+    provenance: ProvenanceMode = ProvenanceMode.FULL
+    address_cache: Optional[AddressCache] = field(default_factory=AddressCache)
+    zip_index: Optional[ZipIndex] = field(default_factory=default_zip_index)
+    router: ValidationRouter = field(default_factory=ValidationRouter, init=False)
+    error_aggregator: ErrorAggregator = field(default_factory=ErrorAggregator, init=False)
     _records: Optional[Iterable[Dict[str, Any]]] = field(default=None, init=False)
     _validation_pipeline: Optional[Generator[RunValidationOutput, None, None]] = field(default=None, init=False)
+    _workers: int = field(default=1, init=False)
+    _chunk_size: int = field(default=1000, init=False)
+    _valid_count: int = field(default=0, init=False)
+    _invalid_count: int = field(default=0, init=False)
+    _checkpoint_path: Optional[Path] = field(default=None, init=False)
+    _checkpoint_every: int = field(default=100_000, init=False)
+    _resume_offset: int = field(default=0, init=False)
+    _started: bool = field(default=False, init=False)
+    _shard: Shard = field(default=(0, 1), init=False)
+    _blanks_normalized: bool = field(default=False, init=False)
 
     def __post_init__(self):
         self._set_table_names()
-        self.renaming_validator = RecordRenameValidator(self.state_name, self.renaming_validator)
+        self.renaming_validator = RecordRenameValidator(
+            self.state_name,
+            self.renaming_validator,
+            use_plan=self.use_rename_plan
+        )
         self.record_validator = FinalValidation(self.state_name, self.record_validator)
         self.cleanup_validator = CleanUpRecordValidator(self.state_name, self.cleanup_validator)
 
@@ -145,80 +289,353 @@ class CreateValidator:
     def valid(self) -> Generator[PreValidationCleanUp, None, None]:
         if self._validation_pipeline:
             # raise ValueError("run_validation must be called before accessing valid records")
-            for status, record in self._validation_pipeline:
-                if status == 'valid':
-                    # self._handle_collected_groups(record)
-                    yield record
-                if status == 'invalid':
-                    self.renaming_validator._invalid_count += 1
+            yield from self.router.select(self._validation_pipeline, 'valid')
 
     @property
     def invalid(self) -> Generator[Dict[str, Any], None, None]:
         if self._validation_pipeline:
             # raise ValueError("run_validation must be called before accessing invalid records")
-            for status, record in self._validation_pipeline:
-                if status == 'invalid':
-                    # self._handle_collected_groups(record)
-                    yield record
-                if status == 'valid':
-                    self.renaming_validator._valid_count += 1
+            yield from self.router.select(self._validation_pipeline, 'invalid')
+
+    @property
+    def valid_count(self) -> int:
+        return self._valid_count
+
+    @property
+    def invalid_count(self) -> int:
+        return self._invalid_count
+
+    def add_sink(self, status: str, sink: ValidationSink) -> None:
+        self.router.add_sink(status, sink)
+
+    def route(self) -> None:
+        """Runs the whole validation in one pass, sending every result to the registered sinks."""
+        if self._validation_pipeline is None:
+            raise ValueError("run_validation must be called before routing records")
+        self.router.route(self._validation_pipeline)
+
+    def rename_plan(self, columns: Iterable[str]) -> RenamePlan:
+        """The rename plan for a file header, reporting its missing and unmapped columns up front."""
+        return self.renaming_validator.plan(columns)
 
     def _set_table_names(self):
         for table_name, table in SQLModel.metadata.tables.items():
             old_name = table.name
+            if old_name.startswith("voterfile_"):
+                continue
             new_name = f"voterfile_{old_name}"
             table.name = new_name
 
-    def validate_single_record(self, record: Dict[str, Any]) -> Generator[Tuple[str, Any], None, None]:
-        renamed_record_gen = self.renaming_validator.validate_single_record(record)
-        renamed_result = next(renamed_record_gen)
+    def _validate(self, record: Dict[str, Any]) -> ValidatorOutput:
+        # The renamer and cleanup validators read these settings from the context.
+        _provenance = PROVENANCE_MODE.set(self.provenance)
+        _blanks = BLANKS_NORMALIZED.set(self._blanks_normalized)
+        _addresses = ADDRESS_CACHE.set(self.address_cache)
+        _zips = ZIP_INDEX.set(self.zip_index)
+        try:
+            return self._validate_record(record)
+        finally:
+            ZIP_INDEX.reset(_zips)
+            ADDRESS_CACHE.reset(_addresses)
+            BLANKS_NORMALIZED.reset(_blanks)
+            PROVENANCE_MODE.reset(_provenance)
+
+    def _validate_record(self, record: Dict[str, Any]) -> ValidatorOutput:
+        if self.prefilter and (_rejected := PROFILER.call('prefilter', self.prefilter.check, record)):
+            return 'invalid', _rejected
+        renamed_result = PROFILER.call('rename', self.renaming_validator._validate, record)
         if renamed_result[0] == 'valid':
             renamed_dict = dict(renamed_result[1])
             renamed_dict['data'] = renamed_result[1]
-            cleaned_record_gen = self.cleanup_validator.validate_single_record(renamed_dict)
-            cleaned_result = next(cleaned_record_gen)
+            cleaned_result = PROFILER.call('cleanup', self.cleanup_validator._validate, renamed_dict)
             if cleaned_result[0] == 'valid':
                 # # self._handle_collected_groups(cleaned_result)
                 # final_record_gen = self.record_validator.validate_single_record(dict(cleaned_result[1]))
                 # final_result = next(final_record_gen)
                 # _container.final_model = final_result[1]
-                yield "valid", cleaned_result[1]
+                return "valid", cleaned_result[1]
             else:
-                yield 'invalid', ErrorDetails(
+                return 'invalid', ErrorDetails(
                     model=self.cleanup_validator.__class__.__name__,
                     point_of_failure="cleanup",
                     errors=cleaned_result[1].errors
                 )
         else:
-            yield 'invalid', ErrorDetails(
+            return 'invalid', ErrorDetails(
                 model=self.renaming_validator.__class__.__name__,
                 point_of_failure="rename",
                 errors=renamed_result[1].errors
             )
 
+    def validate_single_record(self, record: Dict[str, Any]) -> Generator[Tuple[str, Any], None, None]:
+        yield self._validate(record)
+
+    def validate_batch(self, records: Iterable[Dict[str, Any]]) -> ValidationBatch:
+        """Runs rename -> cleanup over a whole chunk and returns a columnar `ValidationBatch`."""
+        batch = ValidationBatch()
+        for i, record in enumerate(records):
+            batch.add(i, *self._validate(record))
+        if self.address_cache is not None:
+            self.address_cache.flush()
+        return batch
+
     def create_validation_pipeline(self) -> Generator[RunValidationOutput, None, None]:
         if self._records is None:
             raise ValueError("run_validation must be called before creating the validation pipeline")
+        self._started = True
+        if self._resume_offset:
+            self._records = itertools.islice(self._records, self._resume_offset, None)
 
         # with ThreadPoolExecutor() as executor:
         #     futures = [executor.submit(self.validate_single_record, record) for record in self._records]
         #     for future in as_completed(futures):
         #         yield from future.result()
 
-        for record in self._records:
-            yield from self.validate_single_record(record)
+        if self._workers > 1:
+            _results = self._create_parallel_pipeline()
+        else:
+            _results = (self._validate(record) for record in self._records)
+
+        # Count at the source so both counters stay correct whichever side is consumed.
+        for status, result in _results:
+            self._count_result(status, result)
+            yield status, result
+            # The consumer has finished with this record once the generator is resumed.
+            if self._checkpoint_path and (self._valid_count + self._invalid_count) % self._checkpoint_every == 0:
+                self.save_checkpoint(self._checkpoint_path)
+        if self._checkpoint_path:
+            self.save_checkpoint(self._checkpoint_path)
+        if self.address_cache is not None:
+            self.address_cache.flush()
+
+    def _count_result(self, status: str, result: PreValidationCleanUp | ErrorDetails) -> None:
+        if status == 'valid':
+            self._valid_count += 1
+        else:
+            self._invalid_count += 1
+            self.error_aggregator.add(result)
+
+    def _create_process_pool(self, workers: int) -> ProcessPoolExecutor:
+        if self.field_path is None:
+            raise ValueError("field_path must be set to rebuild the renaming model in worker processes")
+        if self.address_cache is not None:
+            # Forked workers must not inherit an open SQLite handle or entries the parent has yet to write.
+            self.address_cache.close()
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_validation_worker,
+            initargs=(
+                self.state_name,
+                self.field_path,
+                self.record_validator.validator,
+                self.cleanup_validator.validator,
+                self.prefilter,
+                self.use_rename_plan,
+                self.provenance,
+                self._blanks_normalized,
+                self.address_cache,
+                self.zip_index
+            )
+        )
+
+    def _create_parallel_pipeline(self) -> Generator[ValidatorOutput, None, None]:
+        _max_pending = self._workers * 2
+        if isinstance(self._records, PartitionedSource):
+            yield from self._create_partitioned_pipeline(_max_pending)
+            return
+        with self._create_process_pool(self._workers) as executor:
+            # Results are yielded in input order, with at most `_max_pending` tasks in flight.
+            pending = deque()
+            for task in itertools.batched(self._records, self._chunk_size):
+                pending.append(executor.submit(_validate_chunk, task))
+                if len(pending) >= _max_pending:
+                    yield from pending.popleft().result().results()
+            while pending:
+                yield from pending.popleft().result().results()
+
+    def _create_partitioned_pipeline(self, max_pending: int) -> Generator[ValidatorOutput, None, None]:
+        # The manager exits first, which unblocks workers still waiting on a full queue if the consumer stops early.
+        with self._create_process_pool(self._workers) as executor, multiprocessing.Manager() as manager:
+            # Partitions are consumed in submission order. Each streams its results through a queue holding at
+            # most two chunks, so memory is bounded by `chunk_size` rather than by the size of a partition.
+            pending = deque()
+            for partition in self._records.partitions():
+                _results = manager.Queue(maxsize=2)
+                pending.append((executor.submit(_validate_partition, partition, self._chunk_size, _results), _results))
+                if len(pending) >= max_pending:
+                    yield from _partition_results(*pending.popleft())
+            while pending:
+                yield from _partition_results(*pending.popleft())
+
+    def _voter_id_columns(self) -> List[str]:
+        """Input columns the renamer reads `voter_vuid` from, used as the sharding key."""
+        _field = self.renaming_validator.validator.model_fields.get('voter_vuid')
+        if _field is None or _field.validation_alias is None:
+            return []
+        _alias = _field.validation_alias
+        return [x for x in getattr(_alias, 'choices', [_alias]) if isinstance(x, str)]
+
+    def shard_result(self, loader: Optional["CreateRecords"] = None, outputs: Iterable[Path] = ()) -> ShardResult:
+        """
+        The counters, error aggregator and output files of this shard, with the elections and vote file of
+        `loader`. Create the loader with `election_votes_path` so the elections can be merged.
+        """
+        if loader is not None:
+            loader.close_election_votes()
+        return ShardResult(
+            shard=self._shard,
+            valid_count=self._valid_count,
+            invalid_count=self._invalid_count,
+            error_summary=self.error_aggregator.summary(),
+            error_aggregator=self.error_aggregator,
+            elections=loader.elections if loader is not None else None,
+            election_votes=loader.election_votes_path if loader is not None else None,
+            outputs=list(outputs)
+        )
+
+    def checkpoint(self) -> ValidationCheckpoint:
+        return ValidationCheckpoint(
+            offset=self._valid_count + self._invalid_count,
+            valid_count=self._valid_count,
+            invalid_count=self._invalid_count,
+            error_aggregator=self.error_aggregator
+        )
 
-    def run_validation(self, records: Iterable[Dict[str, Any]]) -> None:
+    def save_checkpoint(self, path: Path) -> ValidationCheckpoint:
+        checkpoint = self.checkpoint()
+        checkpoint.save(path)
+        return checkpoint
+
+    def resume(self, checkpoint: ValidationCheckpoint) -> None:
+        """
+        Restores the counters and error aggregator saved in `checkpoint` and skips the input records it had
+        processed. Resuming twice from the same checkpoint skips them once.
+        """
+        if self._started:
+            raise ValueError("resume must be called before the validation pipeline is consumed")
+        self._valid_count = checkpoint.valid_count
+        self._invalid_count = checkpoint.invalid_count
+        if checkpoint.error_aggregator is not None:
+            self.error_aggregator = checkpoint.error_aggregator
+        self._resume_offset = checkpoint.offset
+
+    def run_validation(
+            self,
+            records: Iterable[Dict[str, Any]],
+            workers: int = 1,
+            chunk_size: int = 1000,
+            checkpoint_path: Optional[Path] = None,
+            checkpoint_every: int = 100_000,
+            resume_from: Optional[Path] = None,
+            shard: Optional[Shard] = None) -> None:
+        """
+        Sets up the validation pipeline over `records`.
+
+        With `workers > 1`, records are sent to a process pool in chunks of `chunk_size`. A `PartitionedSource`
+        such as `ParquetReader` is instead split into its partitions, and each worker reads its own and sends
+        its results back in chunks of `chunk_size`.
+
+        With `shard=(i, n)`, only the records of shard `i` out of `n` are validated. Records are assigned by a
+        stable hash of their raw voter id, or of their row number when they have none, so `n` nodes running
+        over the same file cover it exactly once. A `PartitionedSource` stays partitioned, each worker filtering
+        the partition it reads. Combine their results with `merge_shard_results`.
+
+        With `checkpoint_path`, progress is saved every `checkpoint_every` consumed records and when the
+        pipeline is exhausted. `resume_from` loads such a checkpoint, restores the counters and error summary
+        and skips the input records that were already processed. When the valid records are loaded with
+        `CreateRecords.create_db_records`, checkpoint the load instead and pass it this validator, so a single
+        checkpoint holds both positions.
+        """
+        if workers < 1 or chunk_size < 1 or checkpoint_every < 1:
+            raise ValueError("workers, chunk_size and checkpoint_every must be positive integers")
+        # Readers created with `normalize=True` have already cleared blanks column-wise.
+        self._blanks_normalized = bool(getattr(records, 'normalize', False))
+        if shard:
+            self._shard = check_shard(shard)
+            records = shard_records(records, self._shard, self._voter_id_columns())
         self._records = records
+        self._started = False
+        self._resume_offset = 0
+        if resume_from:
+            self.resume(ValidationCheckpoint.load(resume_from))
+        self._workers = workers
+        self._chunk_size = chunk_size
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_every = checkpoint_every
         self._validation_pipeline = self.create_validation_pipeline()
 
+    async def run_validation_async(
+            self,
+            records: AsyncIterable[Dict[str, Any]],
+            chunk_size: int = 1000,
+            max_pending: int = 4,
+            workers: int = 1,
+            executor: Optional[Executor] = None
+    ) -> AsyncGenerator[ValidatorOutput, None]:
+        """
+        Streams `records` through rename -> cleanup without blocking the event loop.
+
+        Records are read into chunks of `chunk_size` and validated off the loop, in `executor` or, with
+        `workers > 1`, in a process pool. The queues between the read, validate and output stages hold at
+        most `max_pending` chunks each, so a slow consumer applies backpressure all the way to the reader.
+        """
+        if chunk_size < 1 or max_pending < 1:
+            raise ValueError("chunk_size and max_pending must be positive integers")
+
+        loop = asyncio.get_running_loop()
+        _done = object()
+        _chunks: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        _batches: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        _pool = self._create_process_pool(workers) if workers > 1 else None
+        _validate_func = _validate_chunk if _pool else self.validate_batch
+
+        async def read() -> None:
+            chunk = []
+            try:
+                async for record in records:
+                    chunk.append(record)
+                    if len(chunk) >= chunk_size:
+                        await _chunks.put(chunk)
+                        chunk = []
+                if chunk:
+                    await _chunks.put(chunk)
+                await _chunks.put(_done)
+            except Exception as e:
+                await _chunks.put(e)
+
+        async def validate() -> None:
+            try:
+                while (chunk := await _chunks.get()) is not _done:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    await _batches.put(await loop.run_in_executor(_pool or executor, _validate_func, chunk))
+                await _batches.put(_done)
+            except Exception as e:
+                await _batches.put(e)
+
+        # Failures in either stage are passed down the queues and re-raised here.
+        tasks = [asyncio.create_task(read()), asyncio.create_task(validate())]
+        try:
+            while (batch := await _batches.get()) is not _done:
+                if isinstance(batch, Exception):
+                    raise batch
+                for status, result in batch.results():
+                    self._count_result(status, result)
+                    yield status, result
+        finally:
+            for task in tasks:
+                task.cancel()
+            if _pool:
+                _pool.shutdown(wait=False, cancel_futures=True)
+
     def get_error_summary(self) -> Dict[str, int]:
-        error_summary = {}
-        for validator in [self.renaming_validator, self.cleanup_validator, self.record_validator]:
-            for error in validator.invalid:
-                error_type = error['error_type']
-                error_summary[error_type] = error_summary.get(error_type, 0) + 1
-        return error_summary
+        """Failed record counts by error type, aggregated as the pipeline runs."""
+        return self.error_aggregator.summary()
+
+    @staticmethod
+    def get_timing_report() -> pd.DataFrame:
+        """Per-stage and per-cleanup-validator timings, collected while `PROFILER` is enabled."""
+        return PROFILER.report()
 
 
 @dataclass
@@ -227,6 +644,22 @@ class CreateRecords:
     records: list[RecordBaseModel] = field(default_factory=list)
     errors: list[PreValidationCleanUp] = field(default_factory=list)
     elections: ElectionList = field(default_factory=ElectionList)
+    election_votes_path: Optional[Path] = None
+    _election_votes_file: Optional[IO[bytes]] = field(default=None, init=False, repr=False)
+
+    def _add_election_vote(self, election: Any, vote_method: Any, vote_record: Any) -> None:
+        # Sharded runs append every vote to disk, so `merge_shard_results` can replay them into one `ElectionList`.
+        self.elections.add_or_update_election(election=election, vote_method=vote_method, vote_record=vote_record)
+        if self.election_votes_path is not None:
+            if self._election_votes_file is None:
+                self._election_votes_file = open(self.election_votes_path, "ab")
+            write_election_vote(self._election_votes_file, election, vote_method, vote_record)
+
+    def close_election_votes(self) -> None:
+        """Closes the `election_votes_path` file; later votes are appended to it."""
+        if self._election_votes_file is not None:
+            self._election_votes_file.close()
+            self._election_votes_file = None
 
     def _get_or_create_person_name(self, person_name: PersonName, session: Session) -> PersonName:
         existing = session.execute(
@@ -345,11 +778,7 @@ class CreateRecords:
                 vote_record.election = election
                 vote_record.vote_method = vote_method
                 record.vote_history.append(vote_record)
-                self.elections.add_or_update_election(
-                    election=election,
-                    vote_method=vote_method,
-                    vote_record=vote_record
-                )
+                self._add_election_vote(election, vote_method, vote_record)
             session.add(record)
             session.commit()
             return record
@@ -360,21 +789,67 @@ class CreateRecords:
             self.errors.append(data)
 
 
-    def create_db_records(self, records: Iterable[PreValidationCleanUp]) -> None:
+    def _save_checkpoint(self, path: Path, persisted: int, validator: Optional[CreateValidator] = None) -> None:
+        checkpoint = validator.checkpoint() if validator is not None else ValidationCheckpoint()
+        checkpoint.persisted = persisted
+        checkpoint.failed = self.errors
+        checkpoint.elections = self.elections
+        checkpoint.save(path)
+
+    def create_db_records(
+            self,
+            records: Iterable[PreValidationCleanUp],
+            checkpoint_path: Optional[Path] = None,
+            checkpoint_every: int = 10000,
+            resume_from: Optional[Path] = None,
+            validator: Optional[CreateValidator] = None) -> None:
+        """
+        Loads `records` into the database, committing each one. Records that cannot be stored are kept in
+        `errors`.
+
+        With `checkpoint_path`, the number of records processed, the failed records and the accumulated
+        `ElectionList` are saved every `checkpoint_every` records and at the end of the load. `resume_from`
+        restores them and skips the records that were already loaded. Records stored after the last checkpoint
+        are loaded again, and fail as duplicates.
+
+        When `records` is `validator.valid`, pass the validator too. Its input offset, counters and error
+        summary are then saved in the same checkpoint, and on resume the validator skips the input records
+        behind the saved position instead of the load skipping valid records a second time.
+        """
+        _start = 0
+        if resume_from:
+            checkpoint = ValidationCheckpoint.load(resume_from)
+            _start = checkpoint.persisted
+            self.errors = list(checkpoint.failed or [])
+            if checkpoint.elections is not None:
+                self.elections = checkpoint.elections
+            if validator is not None:
+                validator.resume(checkpoint)
+            else:
+                records = itertools.islice(records, _start, None)
+
+        i = _start
         with Session(self.engine) as session:
             with session.no_autoflush:
-                for i, record in enumerate(records, 1):
+                for i, record in enumerate(records, _start + 1):
                     try:
-                        self._each_record_cleanup(record, session)
+                        PROFILER.call('persist', self._each_record_cleanup, record, session)
                         if i % 10000 == 0:
                             print(f"Processed {i:,} records")
                     except Exception as e:
+                        session.rollback()
+                        self.errors.append(record)
                         print(f"Error processing record {i}: {str(e)}")
                         continue  # Skip failed records and continue with the next one
+                    finally:
+                        if checkpoint_path and i % checkpoint_every == 0:
+                            self._save_checkpoint(checkpoint_path, i, validator)
+        if checkpoint_path:
+            self._save_checkpoint(checkpoint_path, i, validator)
 
     def _create_non_db_record(self, record: PreValidationCleanUp) -> RecordBaseModel:
         for e in record.elections:
-            self.elections.add_or_update_election(e.election, e.vote_method, e.vote_record)
+            self._add_election_vote(e.election, e.vote_method, e.vote_record)
 
         # _turnout_calc = ElectionTurnoutCalculator()
         # _election_score = _turnout_calc.calculate_scores(
@@ -401,7 +876,7 @@ class CreateRecords:
     def election_generator(self, records: Iterable[PreValidationCleanUp]):
         for record in records:
             for e in record.elections:
-                self.elections.add_or_update_election(e.election, e.vote_method, e.vote_record)
+                self._add_election_vote(e.election, e.vote_method, e.vote_record)
 
 
     def create_records(self, records: Iterable[PreValidationCleanUp]) -> Generator[RecordBaseModel, None, None]:
@@ -5,4 +5,5 @@ from .address_validation import (
     AddressValidationFuncs,
     AddressTypeList,
     AddressType
-)
\ No newline at end of file
+)
+from .record_prefilter import RecordPreFilter
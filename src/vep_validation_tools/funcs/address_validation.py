@@ -1,5 +1,8 @@
 
-from typing import Any, Dict, List
+import re
+import itertools
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from functools import partial
 from enum import StrEnum
 
@@ -7,6 +10,14 @@ import usaddress
 from rapidfuzz import fuzz
 from scourgify import NormalizeAddress
 from scourgify.exceptions import AddressNormalizationError
+from scourgify.address_constants import (
+    DIRECTIONAL_REPLACEMENTS,
+    OCCUPANCY_TYPE_ABBREVIATIONS,
+    STATE_ABBREVIATIONS,
+    STREET_TYPE_ABBREVIATIONS
+)
+from scourgify.cleaning import clean_period_char
+from scourgify.normalize import get_ordinal_indicator, normalize_address_components, post_clean_addr_str
 
 from pydantic import BaseModel
 from pydantic_core import PydanticCustomError
@@ -14,6 +25,8 @@ from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 from ..utils import default_helpers as helpers
 from ..utils import default_funcs as vfuncs
+from ..utils.address_cache import ADDRESS_CACHE, CachedAddress
+from ..utils.zip_index import ZIP_INDEX
 from .record_keygen import RecordKeyGenerator
 from ..pydantic_models.rename_model import RecordRenamer
 
@@ -34,11 +47,59 @@ AddressTypeList = [AddressType.MAIL, AddressType.RESIDENCE]
 
 AddressLinesAndPartsDict = dict[str, Dict[str, helpers.AddressPartsDict | helpers.AddressLinesOrdered]]
 
+# The usaddress labels the `AddressNormalizationError` fallback builds address lines from.
+FALLBACK_PART_LABELS = ('USPSBoxType', 'USPSBoxID', 'PlaceName', 'StateName', 'ZipCode')
+
+# Address parts that must match the address line of the same name for the tagged parts to be reused.
+LINE_PART_LABELS = (('PlaceName', 'city'), ('StateName', 'state'), ('ZipCode', 'zip5'), ('ZipPlus4', 'zip4'))
+
+# The pre-split `{type}_part_*` columns `parts_from_columns` can place, with the usaddress label of each.
+PART_COLUMN_LABELS = {
+    'number': 'AddressNumber',
+    'street_pre_directional': 'StreetNamePreDirectional',
+    'street_name': 'StreetName',
+    'street_type': 'StreetNamePostType',
+    'street_post_directional': 'StreetNamePostDirectional',
+    'unit_type': 'OccupancyType',
+    'unit_num': 'OccupancyIdentifier',
+    'city': 'PlaceName',
+    'state': 'StateName',
+    'zip5': 'ZipCode',
+    'zip4': 'ZipPlus4',
+}
+
+REQUIRED_PART_COLUMNS = ('number', 'street_name', 'city', 'state', 'zip5')
+
+ADDRESS_NUMBER_PATTERN = re.compile(r"\d+[A-Z]?")
+
+ZIPCODE_PATTERN = re.compile(r"(\d{5})(?:-?(\d{4}))?")
+
+STATE_CODES = frozenset(STATE_ABBREVIATIONS.values())
+
+DIRECTIONALS = frozenset(DIRECTIONAL_REPLACEMENTS) | frozenset(DIRECTIONAL_REPLACEMENTS.values())
+
+# Words usaddress can tag as a `StreetNamePreType` ("HIGHWAY 71", "COUNTY ROAD 12", "AVENUE B").
+STREET_PRE_TYPES = (
+    frozenset(STREET_TYPE_ABBREVIATIONS) | frozenset(STREET_TYPE_ABBREVIATIONS.values())
+    | frozenset(('COUNTY', 'STATE', 'INTERSTATE', 'US', 'FM', 'SR', 'CR'))
+)
+
+
+class TaggedNormalizeAddress(NormalizeAddress):
+    """A scourgify `NormalizeAddress` that keeps the normalized usaddress components of the last address."""
+    tagged: Optional[Dict[str, str]] = None
+
+    def normalize_address_components(self, parsed_addr, long_hand=False):
+        self.tagged = normalize_address_components(parsed_addr, long_hand=long_hand)
+        return self.tagged
+
+
 @pydantic_dataclass
 class AddressValidationFuncs:
 
     @staticmethod
-    def create_address_lines(address_dict: dict, _type: str) -> helpers.AddressLinesOrdered:
+    def address_string(address_dict: dict, _type: str) -> str | None:
+        """Assembles the raw address string for one address type, the input to the address parsers."""
         if _type in AddressTypeList:
             d = address_dict
             _city, _state, _zip5, _adr_str = None, None, None, None
@@ -75,57 +136,84 @@ class AddressValidationFuncs:
                     if k.startswith(_type) and v
                 )
                 _adr_str = " ".join([v for k, v in d.items() if k.startswith(f"{_type}") and v])
+            return _adr_str
+
+    @staticmethod
+    def tag_address_string(_adr_str: str) -> Tuple[helpers.AddressLinesOrdered, Dict[str, str]]:
+        """
+        Normalizes a raw address string into address lines, along with the usaddress components the lines
+        were built from, cleaned the same way as the lines.
+        """
+        _new_address = {}
+        _normalizer = TaggedNormalizeAddress(_adr_str)
+        try:
+            _std = _normalizer.normalize()
+            _tagged = {k: post_clean_addr_str(v) for k, v in (_normalizer.tagged or {}).items()}
+        except AddressNormalizationError as e:
+            _std = None
+            _reattempt_parse = usaddress.parse(_adr_str)
+            _tagged = {}
+            for part, type_ in _reattempt_parse:
+                if type_ in FALLBACK_PART_LABELS:
+                    _tagged[type_] = f"{_tagged[type_]} {part}" if type_ in _tagged else part
+                match type_:
+                    case "USPSBoxType":
+                        if _adr1 := _new_address.get('address1'):
+                            _new_address['address1'] += f" {part}".strip()
+                        else:
+                            _new_address['address1'] = part
+                    case "USPSBoxID":
+                        if _new_address.get('address1'):
+                            _new_address['address1'] += f" {part}".strip()
+                        else:
+                            _new_address['address1'] = part
+                    case "PlaceName":
+                        if _new_address.get('city'):
+                            _new_address['city'] += f" {part}".strip()
+                        else:
+                            _new_address['city'] = part
+                    case "StateName":
+                        if _new_address.get('state'):
+                            _new_address['state'] += f" {part}".strip()
+                        else:
+                            _new_address['state'] = part
+                    case "ZipCode":
+                        if _new_address.get('zip5'):
+                            _new_address['zip5'] += f" {part}".strip()
+                        else:
+                            _new_address['zip5'] = part
+
+        if _std:
+            if (adr1 := _std.get('address_line_1', None)):
+                _new_address["address1"] = adr1
+            if (adr2 := _std.get('address_line_2', None)):
+                _new_address["address2"] = adr2
+            if city := _std.get('city', None):
+                _new_address["city"] = city
+            if state := _std.get('state', None):
+                _new_address["state"] = state
+            if _zip := _std.get('postal_code', None):
+                _split =_zip.split('-')
+                _new_address["zip5"] = _split[0]
+                if len(_split) > 1:
+                    _new_address["zip4"] = _split[1]
+            # The lines carry the normalized state and the split zipcode; the tags still hold the raw ones.
+            for _label, _key in (('StateName', 'state'), ('ZipCode', 'zip5'), ('ZipPlus4', 'zip4')):
+                if _key in _new_address:
+                    _tagged[_label] = _new_address[_key]
+        _new_address['standardized'] = ", ".join([v for k, v in _new_address.items() if v])
+        return helpers.AddressLinesOrdered(**_new_address), {k: v for k, v in _tagged.items() if v}
 
-            _new_address = {}
-            try:
-                _std = NormalizeAddress(_adr_str).normalize()
-            except AddressNormalizationError as e:
-                _std = None
-                _reattempt_parse = usaddress.parse(_adr_str)
-                for part, type_ in _reattempt_parse:
-                    match type_:
-                        case "USPSBoxType":
-                            if _adr1 := _new_address.get('address1'):
-                                _new_address['address1'] += f" {part}".strip()
-                            else:
-                                _new_address['address1'] = part
-                        case "USPSBoxID":
-                            if _new_address.get('address1'):
-                                _new_address['address1'] += f" {part}".strip()
-                            else:
-                                _new_address['address1'] = part
-                        case "PlaceName":
-                            if _new_address.get('city'):
-                                _new_address['city'] += f" {part}".strip()
-                            else:
-                                _new_address['city'] = part
-                        case "StateName":
-                            if _new_address.get('state'):
-                                _new_address['state'] += f" {part}".strip()
-                            else:
-                                _new_address['state'] = part
-                        case "ZipCode":
-                            if _new_address.get('zip5'):
-                                _new_address['zip5'] += f" {part}".strip()
-                            else:
-                                _new_address['zip5'] = part
-
-            if _std:
-                if (adr1 := _std.get('address_line_1', None)):
-                    _new_address["address1"] = adr1
-                if (adr2 := _std.get('address_line_2', None)):
-                    _new_address["address2"] = adr2
-                if city := _std.get('city', None):
-                    _new_address["city"] = city
-                if state := _std.get('state', None):
-                    _new_address["state"] = state
-                if _zip := _std.get('postal_code', None):
-                    _split =_zip.split('-')
-                    _new_address["zip5"] = _split[0]
-                    if len(_split) > 1:
-                        _new_address["zip4"] = _split[1]
-            _new_address['standardized'] = ", ".join([v for k, v in _new_address.items() if v])
-            return helpers.AddressLinesOrdered(**_new_address)
+    @staticmethod
+    def normalize_address_string(_adr_str: str) -> helpers.AddressLinesOrdered:
+        return AddressValidationFuncs.tag_address_string(_adr_str)[0]
+
+    @staticmethod
+    def create_address_lines(address_dict: dict, _type: str) -> helpers.AddressLinesOrdered:
+        if _type in AddressTypeList:
+            return AddressValidationFuncs.normalize_address_string(
+                AddressValidationFuncs.address_string(address_dict, _type)
+            )
 
     @staticmethod
     def create_address_parts(
@@ -143,3 +231,238 @@ class AddressValidationFuncs:
                 _parts[_type] = _part
         address_dict['parts'] = helpers.AddressPartsDict(**_parts)
         return address_dict
+
+    @staticmethod
+    def tags_match_lines(address_lines: helpers.AddressLinesOrdered, tagged: Dict[str, str]) -> bool:
+        """
+        Whether the tagged components spell out exactly the tokens of the standardized address, agree with its
+        city, state and zipcode, and only use labels `AddressPartsDict` keeps.
+        """
+        return (
+            bool(tagged)
+            and all(label in helpers.AddressPartsDict.model_fields for label in tagged)
+            and all(tagged.get(label) == getattr(address_lines, key) for label, key in LINE_PART_LABELS)
+            and " ".join(tagged.values()).split() == address_lines.standardized.replace(',', "").split()
+        )
+
+    @staticmethod
+    def parse_address(_adr_str: str) -> AddressLinesAndPartsDict:
+        """
+        Builds the address lines and parts of a raw address string from a single usaddress parse. The tagged
+        components become the parts when they match the lines; otherwise the standardized address is parsed
+        again, as `create_address_parts` does.
+        """
+        _lines, _tagged = AddressValidationFuncs.tag_address_string(_adr_str)
+        if AddressValidationFuncs.tags_match_lines(_lines, _tagged):
+            return {'lines': _lines, 'parts': helpers.AddressPartsDict(**_tagged)}
+        return AddressValidationFuncs.create_address_parts(_lines)
+
+    @staticmethod
+    def parts_from_columns(address_dict: dict, _type: str) -> Optional[AddressLinesAndPartsDict]:
+        """
+        Builds the address lines and parts straight from pre-split `{type}_part_*` columns, abbreviating
+        directionals, street, unit and state names with scourgify's USPS tables. Returns None, so the address
+        is parsed instead, when a column is not a known part, a required part is missing or has no letters or
+        digits, a value does not look like its part, or the street name starts with a word the parser may tag
+        as a street pre-type. A missing city or state is taken from the current `ZIP_INDEX` when it knows the
+        zip5.
+        """
+        _prefix = f"{_type}_part_"
+        _parts = {}
+        for k, v in address_dict.items():
+            # Punctuation-only values such as "." or "-" are placeholders, treated as missing.
+            if not v or not any(x.isalnum() for x in str(v)):
+                continue
+            if not k.startswith(_prefix) or (_column := k.removeprefix(_prefix)) not in PART_COLUMN_LABELS:
+                return None
+            # Cleaned as scourgify cleans the address string, so "ST. LOUIS" matches the parser's "ST LOUIS".
+            _parts[_column] = post_clean_addr_str(clean_period_char(str(v)))
+        # The zip index can supply a city or state the columns leave out, so the address still skips the parser.
+        _index = ZIP_INDEX.get()
+        if _index is not None and (_zip := ZIPCODE_PATTERN.fullmatch(_parts.get('zip5', ''))):
+            if _entry := _index.get(_zip.group(1)):
+                for _column in ('city', 'state'):
+                    if not _parts.get(_column) and (_value := getattr(_entry, _column)):
+                        _parts[_column] = _value
+        if not all(_parts.get(x) for x in REQUIRED_PART_COLUMNS):
+            return None
+
+        if not ADDRESS_NUMBER_PATTERN.fullmatch(_parts['number']):
+            return None
+        # Directionals and street types left in the street name need the parser to be told apart from it.
+        _street_name = _parts['street_name'].split()
+        if _street_name[0] in DIRECTIONALS or _street_name[-1] in DIRECTIONALS:
+            return None
+        if _street_name[0] in STREET_PRE_TYPES:
+            return None
+        if 'street_type' not in _parts and _street_name[-1] in STREET_TYPE_ABBREVIATIONS:
+            return None
+        if not (_zip := ZIPCODE_PATTERN.fullmatch(_parts['zip5'])):
+            return None
+        _parts['zip5'] = _zip.group(1)
+        if _zip.group(2):
+            if _parts.get('zip4', _zip.group(2)) != _zip.group(2):
+                return None
+            _parts['zip4'] = _zip.group(2)
+        if 'zip4' in _parts and not (_parts['zip4'].isdigit() and len(_parts['zip4']) == 4):
+            return None
+        _state = STATE_ABBREVIATIONS.get(_parts['state'], _parts['state'])
+        if _state not in STATE_CODES:
+            return None
+        _parts['state'] = _state
+        for _column in ('street_pre_directional', 'street_post_directional'):
+            if _column in _parts:
+                _direction = _parts[_column].replace(' ', '').replace('.', '')
+                _direction = DIRECTIONAL_REPLACEMENTS.get(_direction, _direction)
+                if _direction not in DIRECTIONAL_REPLACEMENTS.values():
+                    return None
+                _parts[_column] = _direction
+        if 'street_type' in _parts:
+            if (_street_type := STREET_TYPE_ABBREVIATIONS.get(_parts['street_type'])) is None:
+                return None
+            _parts['street_type'] = _street_type
+            # As scourgify does, numbered streets with a street type get their ordinal indicator.
+            if _parts['street_name'].isdigit():
+                _number = int(_parts['street_name'])
+                _parts['street_name'] = f"{_number}{get_ordinal_indicator(_number).upper()}"
+        if ('unit_type' in _parts) != ('unit_num' in _parts) or _parts.get('unit_num', '').startswith('#'):
+            return None
+        if 'unit_type' in _parts:
+            _unit_type = _parts['unit_type']
+            if _unit_type not in OCCUPANCY_TYPE_ABBREVIATIONS.values():
+                if (_unit_type := OCCUPANCY_TYPE_ABBREVIATIONS.get(_unit_type)) is None:
+                    return None
+            _parts['unit_type'] = _unit_type
+
+        _line_1 = ('number', 'street_pre_directional', 'street_name', 'street_type', 'street_post_directional')
+        _new_address = {
+            'address1': " ".join(_parts[x] for x in _line_1 if x in _parts),
+            'address2': " ".join(_parts[x] for x in ('unit_type', 'unit_num') if x in _parts) or None,
+            'city': _parts['city'],
+            'state': _parts['state'],
+            'zip5': _parts['zip5'],
+            'zip4': _parts.get('zip4'),
+        }
+        _new_address['standardized'] = ", ".join([v for k, v in _new_address.items() if v])
+        return {
+            'lines': helpers.AddressLinesOrdered(**_new_address),
+            'parts': helpers.AddressPartsDict(**{PART_COLUMN_LABELS[k]: v for k, v in _parts.items()})
+        }
+
+    @staticmethod
+    def standardize_address(address_dict: dict, _type: str) -> AddressLinesAndPartsDict:
+        """
+        `parse_address` over the raw address string of one address type, answered from the current
+        `ADDRESS_CACHE` when the same raw address string has been standardized before. Complete pre-split
+        part columns skip both and go through `parts_from_columns`.
+        """
+        if (_from_columns := AddressValidationFuncs.parts_from_columns(address_dict, _type)) is not None:
+            return _from_columns
+        _cache = ADDRESS_CACHE.get()
+        _adr_str = AddressValidationFuncs.address_string(address_dict, _type)
+        if _adr_str is None:
+            return AddressValidationFuncs.create_address_parts(
+                AddressValidationFuncs.create_address_lines(address_dict, _type)
+            )
+        if _cache is not None and (_cached := _cache.get(_adr_str)) is not None:
+            _lines, _parts = _cached
+            return {'lines': helpers.AddressLinesOrdered(**_lines), 'parts': helpers.AddressPartsDict(**_parts)}
+        address_dict = AddressValidationFuncs.parse_address(_adr_str)
+        if _cache is None:
+            return address_dict
+        _cache.put(
+            _adr_str,
+            address_dict['lines'].model_dump(exclude_none=True),
+            address_dict['parts'].model_dump(exclude_none=True)
+        )
+        return address_dict
+
+    @staticmethod
+    def complete_from_zip(address: Any) -> Tuple[List[str], List[str]]:
+        """
+        Fills a missing city, state and county of an address from the current `ZIP_INDEX` entry for its zip5,
+        returning the corrections made and any warnings. An address whose state disagrees with its zipcode is
+        left as is and the mismatch is returned as a warning. `standardized`, and so the address id, is never
+        changed.
+        """
+        _index = ZIP_INDEX.get()
+        if _index is None or (_entry := _index.get(address.zip5)) is None:
+            return [], []
+        if address.state and _entry.state and address.state != _entry.state:
+            return [], [f"zip5 {address.zip5} is in {_entry.state}, not {address.state}"]
+        _corrections = []
+        for _field in ('city', 'state', 'county'):
+            if not getattr(address, _field) and (_value := getattr(_entry, _field)):
+                setattr(address, _field, _value)
+                _corrections.append(f"Filled {_field} '{_value}' from zip5 {address.zip5}")
+        return _corrections, []
+
+    @staticmethod
+    def standardize_addresses(
+            address_dicts: Sequence[dict],
+            _types: Optional[Sequence[str]] = None,
+            workers: int = 1,
+            chunk_size: int = 1000,
+            executor: Optional[Executor] = None) -> List[AddressLinesAndPartsDict]:
+        """
+        `standardize_address` over a batch of raw address dicts, returned in input order.
+
+        Identical raw address strings in the batch are standardized once, and the current `ADDRESS_CACHE` is
+        consulted before parsing. With `workers > 1`, or an `executor`, the remaining unique strings are parsed
+        in a process pool in chunks of `chunk_size`. Each dict's address type is read from its first key unless
+        `_types` is given. Run over a whole file with a disk-backed cache, this pre-standardizes every unique
+        address, so the validation run that follows only reads the cache.
+        """
+        _cache = ADDRESS_CACHE.get()
+        _results: List[Optional[AddressLinesAndPartsDict]] = [None] * len(address_dicts)
+        _indices: Dict[str, List[int]] = {}
+        for i, address_dict in enumerate(address_dicts):
+            _type = _types[i] if _types is not None else next(iter(address_dict), '').split('_')[0]
+            if (_from_columns := AddressValidationFuncs.parts_from_columns(address_dict, _type)) is not None:
+                _results[i] = _from_columns
+            elif (_adr_str := AddressValidationFuncs.address_string(address_dict, _type)) is None:
+                _results[i] = AddressValidationFuncs.standardize_address(address_dict, _type)
+            else:
+                _indices.setdefault(_adr_str, []).append(i)
+
+        _resolved: Dict[str, CachedAddress] = {}
+        if _cache is not None:
+            _resolved = {k: v for k in _indices if (v := _cache.get(k)) is not None}
+        _unresolved = [x for x in _indices if x not in _resolved]
+        if _unresolved and (executor is not None or workers > 1):
+            _chunks = [list(x) for x in itertools.batched(_unresolved, chunk_size)]
+            if executor is not None:
+                _parsed = list(itertools.chain.from_iterable(executor.map(_parse_address_strings, _chunks)))
+            else:
+                if _cache is not None:
+                    # Forked workers must not inherit the cache's open SQLite handle.
+                    _cache.close()
+                with ProcessPoolExecutor(max_workers=workers) as _executor:
+                    _parsed = list(itertools.chain.from_iterable(_executor.map(_parse_address_strings, _chunks)))
+        else:
+            _parsed = _parse_address_strings(_unresolved)
+        for _adr_str, _address in zip(_unresolved, _parsed):
+            _resolved[_adr_str] = _address
+            if _cache is not None:
+                _cache.put(_adr_str, *_address)
+
+        for _adr_str, _positions in _indices.items():
+            _lines, _parts = _resolved[_adr_str]
+            for i in _positions:
+                _results[i] = {
+                    'lines': helpers.AddressLinesOrdered(**_lines),
+                    'parts': helpers.AddressPartsDict(**_parts)
+                }
+        return _results
+
+
+def _parse_address_strings(addresses: Sequence[str]) -> List[CachedAddress]:
+    """Parses raw address strings, returning the lines and parts as plain dicts so they pickle cheaply."""
+    _results = []
+    for _adr_str in addresses:
+        _address = AddressValidationFuncs.parse_address(_adr_str)
+        _results.append((
+            _address['lines'].model_dump(exclude_none=True),
+            _address['parts'].model_dump(exclude_none=True)
+        ))
+    return _results
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, Type
+
+from pydantic import AliasChoices
+
+from ..abcs.create_validator_abc import ErrorDetails
+from ..utils.renamer_funcs import BLANK_VALUES
+from .address_validation import AddressType
+
+PREFILTER_ERRORS = {
+    'missing_name': 'Missing name details. Unable to generate a strong key to match with',
+    'missing_first_name': 'Missing first name. Unable to generate a strong key to match with',
+    'missing_last_name': 'Missing last name. Unable to generate a strong key to match with',
+    'missing_address': 'Missing address information. Unable to generate VEP keys',
+    'missing_residential_address': 'Missing residential address information for voter record.',
+}
+
+
+def _source_columns(name: str, alias: Any) -> Tuple[str, ...]:
+    if isinstance(alias, AliasChoices):
+        _columns = [x for x in alias.choices if isinstance(x, str)]
+    elif isinstance(alias, str):
+        _columns = [alias]
+    else:
+        _columns = []
+    return tuple(dict.fromkeys([*_columns, name]))
+
+
+@dataclass
+class RecordPreFilter:
+    """
+    Rejects obviously unusable raw records before renaming and the full cleanup chain.
+
+    The checks only look up the input columns mapped to each field group, so rows with no name, no first or
+    last name, or no address are rejected without building models or parsing addresses. They fail with the
+    same error codes `PreValidationCleanUp` and `VEPKeyMaker` would raise, at the `prefilter` stage.
+
+    Attributes:
+        columns (Dict[str, Tuple[str, ...]]): The input columns each renamed field is read from.
+        require_name (bool): Reject records without any name, or without a first or last name.
+        require_address (bool): Reject records without any residence or mail address values.
+        require_residence (bool): Reject records without residence address values. Defaults to True for
+            voterfiles, as `check_if_fields_exist` does.
+    """
+    columns: Dict[str, Tuple[str, ...]]
+    require_name: bool = True
+    require_address: bool = True
+    require_residence: bool = False
+    _groups: Dict[str, Tuple[str, ...]] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        for prefix in ('person', 'person_name_first', 'person_name_last', AddressType.RESIDENCE, AddressType.MAIL):
+            self._groups[prefix] = tuple(
+                column for name, columns in self.columns.items() if name.startswith(prefix) for column in columns
+            )
+
+    @classmethod
+    def from_renamer(cls, renamer: Type["RecordRenamer"], **kwargs) -> RecordPreFilter:
+        _columns = {
+            name: _source_columns(name, _field.validation_alias)
+            for name, _field in renamer.model_fields.items()
+        }
+        _settings = renamer.model_fields['settings'].default or {}
+        kwargs.setdefault('require_residence', _settings.get('FILE-TYPE') == 'VOTERFILE')
+        return cls(columns=_columns, **kwargs)
+
+    def _has_value(self, record: Dict[str, Any], group: str) -> bool:
+        for column in self._groups[group]:
+            _value = record.get(column)
+            if _value is None:
+                continue
+            if not isinstance(_value, str):
+                return True
+            if (_value := _value.strip()) and _value not in BLANK_VALUES:
+                return True
+        return False
+
+    def _error(self, record: Dict[str, Any], error_type: str) -> ErrorDetails:
+        return ErrorDetails(
+            model=self.__class__.__name__,
+            point_of_failure="prefilter",
+            errors=[{
+                'type': error_type,
+                'loc': (),
+                'msg': PREFILTER_ERRORS[error_type],
+                'input': record,
+            }]
+        )
+
+    def check(self, record: Dict[str, Any]) -> Optional[ErrorDetails]:
+        """
+        Returns the error a record would certainly fail with later on, or None if it should be validated.
+        Checks run in the order the cleanup validators run, so the first failure is reported.
+        """
+        if self.require_name and not self._has_value(record, 'person'):
+            return self._error(record, 'missing_name')
+        _residence = self._has_value(record, AddressType.RESIDENCE)
+        if self.require_address and not (_residence or self._has_value(record, AddressType.MAIL)):
+            return self._error(record, 'missing_address')
+        if self.require_residence and not _residence:
+            return self._error(record, 'missing_residential_address')
+        if self.require_name:
+            if not self._has_value(record, 'person_name_first'):
+                return self._error(record, 'missing_first_name')
+            if not self._has_value(record, 'person_name_last'):
+                return self._error(record, 'missing_last_name')
+        return None
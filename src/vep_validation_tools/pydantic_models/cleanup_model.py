@@ -11,6 +11,8 @@ from pydantic_core import PydanticCustomError
 from sqlmodel import Field as SQLModelField
 
 from ..utils import default_funcs as vfuncs
+from ..utils.instrumentation import timed
+from ..utils.provenance import PROVENANCE_MODE, ProvenanceMode, original_data
 from .config import ValidatorConfig
 from .validator_record import *
 from .fields.district import District
@@ -55,6 +57,7 @@ class PreValidationCleanUp(CleanUpBaseModel):
         return result
 
     @model_validator(mode='after')
+    @timed('cleanup.filter_fields')
     def filter_fields(self):
         self.raw_data = _raw_data if (_raw_data := self.data.raw_data) else None
         self.date_format = _date_format if (_date_format := self.data.date_format) else None
@@ -62,6 +65,7 @@ class PreValidationCleanUp(CleanUpBaseModel):
         return self
 
     @model_validator(mode='after')
+    @timed('cleanup.filter_name')
     def filter_name(self):
         if not self.name:
             _name = self._filter('person')
@@ -89,6 +93,7 @@ class PreValidationCleanUp(CleanUpBaseModel):
         return self
 
     @model_validator(mode='after')
+    @timed('cleanup.filter_voter_registration')
     def filter_voter_registration(self):
         if not (vr := self._filter('voter')):
             return self
@@ -118,24 +123,29 @@ class PreValidationCleanUp(CleanUpBaseModel):
         return self
 
     @model_validator(mode='after')
+    @timed('cleanup.validate_addresses')
     def validate_addresses(self):
         address_list: List[Address] = list()
         address_count: Dict[AddressType, int] = {AddressType.RESIDENCE: 0, AddressType.MAIL: 0}
 
         _residence = self._filter(AddressType.RESIDENCE)
         _mail = self._filter(AddressType.MAIL)
-        for address, _type in [(_residence, AddressType.RESIDENCE), (_mail, AddressType.MAIL)]:
-            if not address:
-                continue
-            address_lines = AddressValidationFuncs.create_address_lines(
-                address_dict=address,
-                _type=_type)
-            address_parts = AddressValidationFuncs.create_address_parts(address_lines)
+        _addresses = [(x, _type) for x, _type in [(_residence, AddressType.RESIDENCE), (_mail, AddressType.MAIL)] if x]
+        # A mailing address identical to the residence is only standardized once.
+        _standardized = AddressValidationFuncs.standardize_addresses(
+            [x for x, _ in _addresses],
+            _types=[_type for _, _type in _addresses])
+        for (address, _type), address_parts in zip(_addresses, _standardized):
             address_data = Address(
                 address_type=_type,
                 **address_parts['lines'].model_dump(),
             )
-            address_data.address_parts = address_parts['parts']
+            address_data.address_parts = address_parts['parts'].model_dump(exclude_none=True)
+            _zip_corrections, _zip_warnings = AddressValidationFuncs.complete_from_zip(address_data)
+            if _zip_corrections:
+                self.corrected_errors.setdefault('addresses', {})[_type] = _zip_corrections
+            if _zip_warnings:
+                self.validation_warnings.setdefault('addresses', {})[_type] = _zip_warnings
             if _already_exists := next((a for a in address_list if a.id == address_data.id), None):
                 address_data = address_list.pop(address_list.index(_already_exists))
             if _type == AddressType.MAIL:
@@ -194,12 +204,13 @@ class PreValidationCleanUp(CleanUpBaseModel):
         #     single_address.is_residence = single_address.address_type == AddressType.RESIDENCE.value
         #     single_address.is_mailing = single_address.address_type == AddressType.MAIL.value
 
-    validate_edr = model_validator(mode='after')(DateValidators.validate_date_edr)
-    validate_phones = model_validator(mode='after')(PhoneNumberValidationFuncs.validate_phones)
-    validate_dob = model_validator(mode='after')(DateValidators.validate_date_dob)
+    validate_edr = model_validator(mode='after')(timed('cleanup.validate_edr')(DateValidators.validate_date_edr))
+    validate_phones = model_validator(mode='after')(timed('cleanup.validate_phones')(PhoneNumberValidationFuncs.validate_phones))
+    validate_dob = model_validator(mode='after')(timed('cleanup.validate_dob')(DateValidators.validate_date_dob))
     # validate_elections = model_validator(mode='after')(ElectionValidationFuncs.validate_election_history)
 
     @model_validator(mode='after')
+    @timed('cleanup.validate_name')
     def validate_name(self):
         if self.person_details:
             self.person_details = vfuncs.remove_prefix(self.person_details, ['person_', ])
@@ -207,6 +218,7 @@ class PreValidationCleanUp(CleanUpBaseModel):
         return self
 
     @model_validator(mode='after')
+    @timed('cleanup.validate_voter_registration')
     def validate_voter_registration(self):
         if self.input_voter_registration:
             status = None
@@ -226,6 +238,7 @@ class PreValidationCleanUp(CleanUpBaseModel):
         return self
 
     @model_validator(mode='after')
+    @timed('cleanup.validate_vendors')
     def validate_vendors(self):
         _input_vendor_dict = vfuncs.getattr_with_prefix('vendor', self.data)
         if not isinstance(_input_vendor_dict, dict):
@@ -275,6 +288,7 @@ class PreValidationCleanUp(CleanUpBaseModel):
         return self
 
     @model_validator(mode='after')
+    @timed('cleanup.set_districts')
     def set_districts(self):
         def _filter(district: str, district_codes_enum):
             data = {
@@ -348,9 +362,10 @@ class PreValidationCleanUp(CleanUpBaseModel):
                 )
         return self
 
-    check_for_fields = model_validator(mode='after')(vfuncs.check_if_fields_exist)
+    check_for_fields = model_validator(mode='after')(timed('cleanup.check_for_fields')(vfuncs.check_if_fields_exist))
 
     @model_validator(mode='after')
+    @timed('cleanup.set_vuid_in_vote_history')
     def set_vuid_in_vote_history(self):
         if self.elections:
             for election in self.elections:
@@ -359,30 +374,35 @@ class PreValidationCleanUp(CleanUpBaseModel):
         return self
 
     @model_validator(mode='after')
+    @timed('cleanup.set_validator_types')
     def set_validator_types(self):
         # AddressValidationFuncs.process_addresses(self)
         self.name = PersonName(**vfuncs.remove_prefix(self.person_details, ['person_name_', 'person_']))
         _input_data = {
-            'original_data': self.raw_data,
-            'renamed_data': dict(self.data),
+            'original_data': original_data(self.raw_data),
+            'renamed_data': dict(self.data) if PROVENANCE_MODE.get() is ProvenanceMode.FULL else None,
             'corrections': self.corrected_errors,
+            'warnings': self.validation_warnings or None,
             'settings': self.settings,
             'date_format': self.date_format
 
         }
-        [_input_data['renamed_data'].pop(x, None) for x in ['raw_data', 'settings', 'date_format']]
+        if _input_data['renamed_data']:
+            [_input_data['renamed_data'].pop(x, None) for x in ['raw_data', 'settings', 'date_format']]
         self.input_data = InputData(**_input_data)
         return self
 
     @model_validator(mode='after')
+    @timed('cleanup.validate_election_history')
     def validate_election_history(self):
         if self.voter_registration and self.voter_registration.vuid:
             return ElectionValidationFuncs.validate_election_history(self, self.voter_registration.vuid)
         return self
-    generate_vep_keys = model_validator(mode='after')(VEPKeyMaker.create_vep_keys)
+    generate_vep_keys = model_validator(mode='after')(timed('cleanup.generate_vep_keys')(VEPKeyMaker.create_vep_keys))
 
     @model_validator(mode='after')
+    @timed('cleanup.set_file_origin')
     def set_file_origin(self):
-        if _file_origin := self.input_data.original_data.get('file_origin'):
+        if _file_origin := (self.raw_data or {}).get('file_origin'):
             self.data_source.append(DataSource(file=_file_origin))
         return self
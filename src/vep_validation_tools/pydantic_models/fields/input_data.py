@@ -11,6 +11,7 @@ class InputData(SQLModelBase, table=True):
     original_data: Dict[str, Any] | None = SQLModelField(sa_type=JSON, default=None)
     renamed_data: Dict[str, Any] | None = SQLModelField(sa_type=JSON, default=None)
     corrections: Dict[str, Any] | None = SQLModelField(sa_type=JSON, default=None)
+    warnings: Dict[str, Any] | None = SQLModelField(sa_type=JSON, default=None)
     settings: Dict[str, Any] | None = SQLModelField(sa_type=JSON, default=None)
     date_format: Dict[str, Any] | str | None = SQLModelField(sa_type=JSON, default=None)
     records: 'RecordBaseModel' = Relationship(back_populates='input_data')
@@ -1,6 +1,8 @@
 import abc
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Annotated, Type, Any, List, Union
+from typing import Optional, Dict, Annotated, Type, Any, List, Tuple, Union
 
 from pydantic import (
     Field,
@@ -10,7 +12,8 @@ from pydantic import (
 )
 
 from ..utils import renamer_funcs as rename_func
-from ..utils.readers import TomlReader
+from ..utils.readers import load_state_config
+from ..utils.provenance import REFERENCE_KEYS, provenance_data
 from .config import ValidatorConfig
 from ..abcs.toml_record_fields_abc import TomlFileFieldsABC
 
@@ -39,7 +42,44 @@ class RecordRenamer(ValidatorConfig, abc.ABC):
     raw_data: Dict[str, Any] = Field(default_factory=dict)
     date_format: Union[str, List[str]] = Field(...)
     settings: Dict[str, Any] = Field(default_factory=dict)
-    pass
+
+    def __reduce__(self):
+        # Models built by `create_renamed_model` carry the (state, field path) they were built from, so their
+        # instances unpickle in any process by rebuilding the model from the registry.
+        if (_spec := getattr(type(self), '__renamer_spec__', None)) is None:
+            return super().__reduce__()
+        return _restore_renamed_record, (*_spec, self.__getstate__())
+
+
+_RENAMED_MODELS: Dict[str, Type[ValidatorConfig]] = {}
+_RENAMER_REGISTRY: Dict[Tuple[str, str], Type[ValidatorConfig]] = {}
+
+# Field groups the cleanup validators fetch with `getattr_with_prefix`, indexed on every generated model.
+FIELD_GROUP_PREFIXES = (
+    'person', 'person_name', 'voter', 'residence', 'mail', 'contact_phone', 'vendor', 'vendor_names', 'district'
+)
+
+
+def __getattr__(name: str) -> Type[ValidatorConfig]:
+    """
+    Resolves renaming models built by `create_renamed_model` by their registered name, so records
+    validated in worker processes can be pickled back to the parent.
+    """
+    if name in _RENAMED_MODELS:
+        return _RENAMED_MODELS[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _renamed_model_name(state: str, digest: str) -> str:
+    _state = re.sub(r'\W', '_', state.lower())
+    return f"RecordRenamer_{_state}_{digest}"
+
+
+def _restore_renamed_record(state: str, field_path: str, state_dict: Dict[str, Any]) -> RecordRenamer:
+    _model = create_renamed_model(state, Path(field_path))
+    _record = _model.__new__(_model)
+    _record.__setstate__(state_dict)
+    return _record
 
 
 class VALIDATOR_FIELDS(TomlFileFieldsABC):
@@ -54,13 +94,12 @@ class VALIDATOR_FIELDS(TomlFileFieldsABC):
     @property
     def fields(self) -> Dict[str, str]:
         """
-        Reads the field mappings from the TOML file.
+        Reads the field mappings from the compiled, cached TOML config.
 
         Returns:
             Dict[str, str]: A dictionary containing the field mappings.
         """
-        _field_toml = TomlReader(file=self._field_path, name=self._state.lower()).data
-        self._fields = _field_toml
+        self._fields = load_state_config(self._field_path).data
         return self._fields
 
 
@@ -68,6 +107,9 @@ def create_renamed_model(state: str, field_path: Path) -> Type[ValidatorConfig]:
     """
     Creates a dynamic Pydantic model for renaming records based on the provided state and field path.
 
+    Models are memoized per (state, TOML content hash), so the pydantic schema is only built once per process
+    for each state layout, and rebuilt with the same name when a worker process asks for it.
+
     Args:
         state (str): The state for which the model is being created.
         field_path (Path): The path to the TOML file containing the field mappings.
@@ -75,8 +117,13 @@ def create_renamed_model(state: str, field_path: Path) -> Type[ValidatorConfig]:
     Returns:
         Type[ValidatorConfig]: The dynamically created Pydantic model.
     """
+    _key = (state.lower(), load_state_config(field_path).digest)
+    if (_cached := _RENAMER_REGISTRY.get(_key)) is not None:
+        return _cached
+
     _fields = VALIDATOR_FIELDS(_state=state, _field_path=field_path)
-    _not_null_fields = {k: k if v == "null" else v for k, v in _fields.FIELDS.items()}
+    # The compiled config already has "null" replaced with None.
+    _not_null_fields = {k: k if v in (None, "null") else v for k, v in _fields.FIELDS.items()}
 
     # _not_null_fields = {k: v for k, v in _fields.FIELDS.items() if v == "null"}  # Set fields that are not empty/null.
     _validators: Dict[str, Any] = {
@@ -94,7 +141,7 @@ def create_renamed_model(state: str, field_path: Path) -> Type[ValidatorConfig]:
                     Optional[str],
                     Field(
                         default=None,
-                        validation_alias=AliasChoices(*v)
+                        validation_alias=AliasChoices(*[x for x in v if x is not None])
                     )
                 ]
             )
@@ -116,9 +163,97 @@ def create_renamed_model(state: str, field_path: Path) -> Type[ValidatorConfig]:
     # Add a field to store raw original data before transformation
     _field_name_dict['raw_data'] = (Dict[str, Any], Field(default_factory=dict))
 
-    return create_model(
+    _model = create_model(
         'RecordRenamer',
         **_field_name_dict,
         __base__=RecordRenamer,
         __validators__=_validators
     )  # Create the model.
+
+    # Register the model under a stable name so its instances can be pickled.
+    _model.__module__ = __name__
+    _model.__qualname__ = _renamed_model_name(*_key)
+    _model.__renamer_spec__ = (state, str(Path(field_path).resolve()))
+    _model.__field_groups__ = rename_func.prefix_index(_model, FIELD_GROUP_PREFIXES)
+    _RENAMED_MODELS[_model.__qualname__] = _model
+    _RENAMER_REGISTRY[_key] = _model
+    return _model
+
+
+def _field_sources(name: str, alias: Any) -> Tuple[str, ...]:
+    _aliases = [x for x in getattr(alias, 'choices', [alias]) if isinstance(x, str)]
+    return tuple(dict.fromkeys([*_aliases, name]))
+
+
+@dataclass
+class RenamePlan:
+    """
+    Resolves which input column each renamer field reads from, once for a file header.
+
+    Renaming a record then copies the resolved columns directly and builds the model with `model_construct`,
+    instead of having pydantic look up every field's `AliasChoices` on every row. Blank values, whitespace
+    stripping, `raw_data` and the address state check are handled as the renamer's validators would.
+
+    Attributes:
+        model (Type[RecordRenamer]): The renaming model built by `create_renamed_model`.
+        columns (Tuple[str, ...]): The input column names, in file order.
+        sources (Dict[str, str]): The input column each field is read from.
+        missing (Tuple[str, ...]): Mapped fields none of whose TOML columns are in the header.
+        unmapped (Tuple[str, ...]): Header columns no field reads.
+    """
+    model: Type[RecordRenamer]
+    columns: Tuple[str, ...]
+    sources: Dict[str, str] = field(default_factory=dict, init=False)
+    missing: Tuple[str, ...] = field(default=(), init=False)
+    unmapped: Tuple[str, ...] = field(default=(), init=False)
+
+    def __post_init__(self):
+        self.columns = tuple(self.columns)
+        _header = set(self.columns)
+        _missing = []
+        for name, _field in self.model.model_fields.items():
+            if name == 'raw_data':
+                continue
+            _source = next((x for x in _field_sources(name, _field.validation_alias) if x in _header), None)
+            if _source is not None:
+                self.sources[name] = _source
+            elif _field.validation_alias is not None:
+                _missing.append(name)
+        self.missing = tuple(_missing)
+        _read = set(self.sources.values())
+        self.unmapped = tuple(x for x in self.columns if x not in _read and x not in REFERENCE_KEYS)
+        self._items = tuple(self.sources.items())
+        # Settings are read-only, so one copy of the defaults is shared by every record of the file.
+        self._defaults = {
+            name: _field.get_default(call_default_factory=True)
+            for name, _field in self.model.model_fields.items() if name not in self.sources and name != 'raw_data'
+        }
+        _state = (self._defaults.get('settings') or {}).get('STATE')
+        self._abbreviation = _state['abbreviation'] if _state else None
+
+    def rename(self, record: Dict[str, Any]) -> Optional[RecordRenamer]:
+        """
+        Returns the renamed record, or None when it needs full pydantic validation: a value is not a string, or
+        the renamer's validators would fail.
+        """
+        if self._abbreviation is None:
+            return None
+        _normalized = rename_func.BLANKS_NORMALIZED.get()
+        _values = {}
+        for name, source in self._items:
+            _value = record.get(source)
+            if _value.__class__ is str:
+                if not _normalized:
+                    _value = None if _value in rename_func.BLANK_VALUES else _value.strip()
+            elif _value is not None:
+                return None
+            _values[name] = _value
+        _fields_set = {*_values, 'raw_data'}
+        _present = {k: v for k, v in _values.items() if v is not None}
+        for name, value in rename_func.missing_address_states(_present, self._abbreviation):
+            if name not in self.model.model_fields:
+                return None
+            _values[name] = value
+            _fields_set.add(name)
+        _values['raw_data'] = provenance_data(record)
+        return self.model.model_construct(_fields_set, **{**self._defaults, **_values})
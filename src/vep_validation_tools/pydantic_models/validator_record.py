@@ -35,6 +35,7 @@ class CleanUpBaseModel(ValidatorConfig):
     elections: list[ElectionDataTuple] = SQLModelField(default_factory=list)
     election_scores: Optional[ElectionTurnoutCalculator] = SQLModelField(default=None)
     corrected_errors: dict[str, Any] = SQLModelField(default_factory=dict)
+    validation_warnings: dict[str, Any] = SQLModelField(default_factory=dict)
     data_source: list[DataSource] = SQLModelField(default_factory=list)
     input_data: Optional[InputData] = SQLModelField(default=None)
     vep_keys: Optional[VEPMatch] = SQLModelField(default=None)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ADDRESS_CACHE_DIR_ENV = "VEP_ADDRESS_CACHE_DIR"
+
+# Bump when the cached address lines or parts change shape, so stale entries are never read back.
+ADDRESS_CACHE_VERSION = 2
+
+# The cached `AddressLinesOrdered` and `AddressPartsDict` fields for one raw address string.
+CachedAddress = Tuple[Dict[str, Any], Dict[str, Any]]
+
+
+def _parser_versions() -> str:
+    _versions = []
+    for dist in ('usaddress', 'usaddress-scourgify'):
+        try:
+            _versions.append(f"{dist}={metadata.version(dist)}")
+        except metadata.PackageNotFoundError:
+            _versions.append(f"{dist}=unknown")
+    return ";".join(_versions)
+
+
+@dataclass
+class AddressCache:
+    """
+    A content-addressed cache of standardized addresses, keyed by the raw assembled address string.
+
+    Lookups go through an in-process LRU first, then the optional SQLite file at `path`, which survives across
+    runs and can be shared by worker processes. Keys include the parser versions, so upgrading usaddress or
+    scourgify starts a fresh set of entries. New entries are buffered and written in one short transaction
+    every `flush_every` misses, when `flush` is called, and when the validation pipeline finishes.
+
+    The LRU and one connection are shared by the threads of a process and guarded by a lock. A forked child
+    notices the new pid and opens its own connection, leaving the parent's handle and unwritten entries alone.
+
+    Attributes:
+        maxsize (int): The maximum number of entries in the in-process LRU. Defaults to 50,000.
+        path (Optional[Path]): The SQLite file for the on-disk tier. Defaults to `address_cache.sqlite` in the
+            `VEP_ADDRESS_CACHE_DIR` directory when that is set, otherwise no on-disk tier.
+        flush_every (int): The number of new entries buffered before they are written to disk. Defaults to 1,000.
+        hits (int): Lookups answered by either tier.
+        misses (int): Lookups that had to run the parsers.
+    """
+    maxsize: int = 50_000
+    path: Optional[Path] = None
+    flush_every: int = 1_000
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: OrderedDict[str, CachedAddress] = field(default_factory=OrderedDict, init=False, repr=False)
+    _pending: List[Tuple[str, str, str]] = field(default_factory=list, init=False, repr=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _pid: int = field(default_factory=os.getpid, init=False, repr=False)
+    _salt: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self):
+        if self.path is None and (_dir := os.environ.get(ADDRESS_CACHE_DIR_ENV)):
+            self.path = Path(_dir) / "address_cache.sqlite"
+        if self.path is not None:
+            self.path = Path(self.path)
+        self._salt = f"{ADDRESS_CACHE_VERSION};{_parser_versions()}"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes start with an empty LRU and open their own connection to the same file.
+        return {'maxsize': self.maxsize, 'path': self.path, 'flush_every': self.flush_every}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, address: str) -> str:
+        return hashlib.blake2b(f"{self._salt}\x00{address}".encode('utf-8'), digest_size=16).hexdigest()
+
+    def _check_owner(self) -> None:
+        if self._pid != os.getpid():
+            # Sharing a SQLite handle across a fork is undefined, and the parent still owns the pending entries.
+            self._connection = None
+            self._pending = []
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Callers hold `_lock`.
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS addresses "
+                "(key TEXT PRIMARY KEY, lines TEXT NOT NULL, parts TEXT NOT NULL) WITHOUT ROWID"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _remember(self, key: str, value: CachedAddress) -> None:
+        # Callers hold `_lock`.
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, address: str) -> Optional[CachedAddress]:
+        _key = self.key(address)
+        self._check_owner()
+        with self._lock:
+            if (_value := self._entries.get(_key)) is not None:
+                self._entries.move_to_end(_key)
+                self.hits += 1
+                return _value
+            if self.path is not None:
+                _row = self._connect().execute("SELECT lines, parts FROM addresses WHERE key = ?", (_key,)).fetchone()
+                if _row is not None:
+                    _value = (json.loads(_row[0]), json.loads(_row[1]))
+                    self._remember(_key, _value)
+                    self.hits += 1
+                    return _value
+            self.misses += 1
+            return None
+
+    def put(self, address: str, lines: Dict[str, Any], parts: Dict[str, Any]) -> None:
+        _key = self.key(address)
+        self._check_owner()
+        with self._lock:
+            self._remember(_key, (lines, parts))
+            if self.path is None:
+                return
+            self._pending.append((_key, json.dumps(lines), json.dumps(parts)))
+            _full = len(self._pending) >= self.flush_every
+        if _full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered entries to the on-disk tier."""
+        self._check_owner()
+        with self._lock:
+            if not self._pending:
+                return
+            with self._connect() as _connection:
+                _connection.executemany("INSERT OR IGNORE INTO addresses VALUES (?, ?, ?)", self._pending)
+            self._pending.clear()
+
+    def clear(self) -> None:
+        """Empties the in-process LRU. The on-disk tier is left as is; delete the file to drop it."""
+        self._check_owner()
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Flushes and closes the connection. The cache stays usable and reconnects on the next disk lookup."""
+        self.flush()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# The cache consulted by `AddressValidationFuncs.standardize_address`, set per record by `CreateValidator`.
+ADDRESS_CACHE: ContextVar[Optional[AddressCache]] = ContextVar('address_cache', default=None)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional
+
+
+@dataclass
+class ValidationCheckpoint:
+    """
+    A durable progress marker for long-running validation runs and database loads.
+
+    When a load consumes a validator's valid records, both positions are saved together, so resuming skips
+    the input records the validator had processed and nothing more.
+
+    Attributes:
+        offset (int): The number of input records the validator has fully processed.
+        valid_count (int): The number of valid records seen so far.
+        invalid_count (int): The number of invalid records seen so far.
+        elections (Optional[Any]): The accumulated `ElectionList` state, if the run keeps one.
+        error_aggregator (Optional[Any]): The validator's `ErrorAggregator`, so summaries cover the whole run.
+        persisted (int): The number of valid records the database load has processed, stored or failed.
+        failed (Optional[List[Any]]): The records the database load could not store.
+    """
+    offset: int = 0
+    valid_count: int = 0
+    invalid_count: int = 0
+    elections: Optional[Any] = None
+    error_aggregator: Optional[Any] = None
+    persisted: int = 0
+    failed: Optional[List[Any]] = None
+
+    def save(self, path: Path) -> None:
+        """
+        Writes the checkpoint to a temporary file and atomically moves it over `path`, so a crash while
+        saving never leaves a truncated checkpoint behind.
+        """
+        path = Path(path)
+        _tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(_tmp_path, "wb") as f:
+            pickle.dump(self, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(_tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> ValidationCheckpoint:
+        with open(path, "rb") as f:
+            checkpoint = pickle.load(f)
+        if not isinstance(checkpoint, cls):
+            raise ValueError(f"{path} does not contain a {cls.__name__}")
+        return checkpoint
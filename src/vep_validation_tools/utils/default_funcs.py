@@ -4,6 +4,7 @@ from pydantic import AliasChoices, BaseModel
 import re
 
 from ..funcs.address_validation import AddressTypeList
+from .renamer_funcs import prefix_index
 
 
 def check_if_fields_exist(self):
@@ -146,7 +147,12 @@ def dict_with_prefix(pfx: str, dict_: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def getattr_with_prefix(pfx: str, obj: Any) -> Dict[str, Any]:
-    return {key: getattr(obj, key) for key in dir(obj) if key.startswith(pfx) and getattr(obj, key)}
+    # Classes carrying a `__field_groups__` prefix index skip the dir() scan; unseen prefixes are added to it.
+    if (_index := getattr(type(obj), '__field_groups__', None)) is None:
+        return {key: getattr(obj, key) for key in dir(obj) if key.startswith(pfx) and getattr(obj, key)}
+    if (_names := _index.get(pfx)) is None:
+        _names = _index[pfx] = prefix_index(type(obj), [pfx])[pfx]
+    return {key: _value for key in _names if (_value := getattr(obj, key))}
 
 
 def remove_empty_from_dict(dict_: Dict[str, Any]) -> Dict[str, Any]:
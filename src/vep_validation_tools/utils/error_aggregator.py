@@ -0,0 +1,95 @@
+from __future__ import annotations
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from ..abcs.create_validator_abc import ErrorDetails
+
+ErrorKey = Tuple[str, str, str]
+
+
+@dataclass
+class ErrorAggregator:
+    """
+    Aggregates validation errors in-line as the pipeline runs, so summaries never need a second pass
+    over the invalid records.
+
+    Errors are counted by `(stage, error type, field location)`. For each error type only a reservoir
+    sample of `sample_size` example records is kept, so memory is bounded by the number of distinct
+    error types rather than the number of failures.
+
+    Attributes:
+        sample_size (int): The number of example records kept per error type.
+        seed (Optional[int]): Seed for the reservoir sampler, for reproducible samples.
+    """
+    sample_size: int = 10
+    seed: Optional[int] = None
+    counts: Counter = field(default_factory=Counter, init=False)
+    samples: Dict[str, List["ErrorDetails"]] = field(default_factory=dict, init=False)
+    _seen: Counter = field(default_factory=Counter, init=False)
+    _random: random.Random = field(init=False)
+
+    def __post_init__(self):
+        self._random = random.Random(self.seed)
+
+    @staticmethod
+    def error_type(error: "ErrorDetails") -> str:
+        return error.errors[0]['type'] if error.errors else 'unknown'
+
+    def add(self, error: "ErrorDetails") -> None:
+        for e in error.errors or [{}]:
+            _loc = ".".join(str(x) for x in e.get('loc', ()))
+            self.counts[(error.point_of_failure, e.get('type', 'unknown'), _loc)] += 1
+
+        _type = self.error_type(error)
+        self._seen[_type] += 1
+        _samples = self.samples.setdefault(_type, [])
+        if len(_samples) < self.sample_size:
+            _samples.append(error)
+        elif (i := self._random.randrange(self._seen[_type])) < self.sample_size:
+            _samples[i] = error
+
+    def merge(self, other: ErrorAggregator) -> ErrorAggregator:
+        """Folds the counts and samples of another aggregator into this one, keeping each sample uniform."""
+        self.counts.update(other.counts)
+        for _type, _samples in other.samples.items():
+            self.samples[_type] = self._merge_samples(
+                self.samples.get(_type, []), self._seen[_type], _samples, other._seen[_type]
+            )
+        self._seen.update(other._seen)
+        return self
+
+    def _merge_samples(
+            self,
+            samples: List["ErrorDetails"],
+            seen: int,
+            other_samples: List["ErrorDetails"],
+            other_seen: int) -> List["ErrorDetails"]:
+        # Draws without replacement from both populations, taking each pick from a side in proportion to the
+        # failures it has left, so every failure seen by either aggregator is equally likely to be kept.
+        _samples, _other_samples = samples[:], other_samples[:]
+        self._random.shuffle(_samples)
+        self._random.shuffle(_other_samples)
+        merged = []
+        while len(merged) < self.sample_size and (_samples or _other_samples):
+            if _samples and (not _other_samples or self._random.randrange(seen + other_seen) < seen):
+                merged.append(_samples.pop())
+                seen -= 1
+            else:
+                merged.append(_other_samples.pop())
+                other_seen -= 1
+        return merged
+
+    def summary(self) -> Dict[str, int]:
+        """The number of failed records per error type."""
+        return dict(self._seen)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [(*key, count) for key, count in self.counts.items()],
+            columns=['stage', 'error_type', 'loc', 'count'],
+        ).set_index(['stage', 'error_type', 'loc'])
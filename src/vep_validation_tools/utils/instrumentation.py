@@ -0,0 +1,75 @@
+from __future__ import annotations
+import functools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, TypeVar
+
+import pandas as pd
+
+T = TypeVar('T')
+
+
+@dataclass
+class TimingStats:
+    calls: int = 0
+    total: float = 0.0
+
+
+@dataclass
+class ValidationProfiler:
+    """
+    Opt-in wall time and call count instrumentation for the validation stages (rename, cleanup, persist)
+    and for each `PreValidationCleanUp` model validator.
+
+    Timings are collected in the current process only, so profile runs with `workers=1`. When disabled,
+    every instrumented call costs a single attribute check.
+    """
+    enabled: bool = False
+    stats: Dict[str, TimingStats] = field(default_factory=dict)
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+    def record(self, name: str, elapsed: float) -> None:
+        _stats = self.stats.get(name)
+        if _stats is None:
+            _stats = self.stats[name] = TimingStats()
+        _stats.calls += 1
+        _stats.total += elapsed
+
+    def call(self, name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if not self.enabled:
+            return func(*args, **kwargs)
+        _start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record(name, time.perf_counter() - _start)
+
+    def report(self) -> pd.DataFrame:
+        """Timings per stage and validator, slowest first."""
+        _report = pd.DataFrame(
+            [(name, s.calls, s.total) for name, s in self.stats.items()],
+            columns=['name', 'calls', 'total_seconds'],
+        ).set_index('name')
+        _report['mean_ms'] = _report['total_seconds'] / _report['calls'] * 1000
+        return _report.sort_values('total_seconds', ascending=False)
+
+
+PROFILER = ValidationProfiler()
+
+
+def timed(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Records each call of the decorated function under `name` while `PROFILER` is enabled."""
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            return PROFILER.call(name, func, *args, **kwargs)
+        return wrapper
+    return decorator
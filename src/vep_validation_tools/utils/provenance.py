@@ -0,0 +1,33 @@
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Any, Dict, Optional
+
+
+class ProvenanceMode(StrEnum):
+    """
+    How much of each input record is kept for provenance.
+
+    FULL keeps a copy of the whole input record as `InputData.original_data`, and the renamed fields as
+    `renamed_data`. REFERENCE keeps only `file_origin` and `file_row`, which the built-in readers tag onto
+    every record, so the original row can be looked up in the source file. NONE keeps neither.
+    """
+    FULL = 'full'
+    REFERENCE = 'reference'
+    NONE = 'none'
+
+
+PROVENANCE_MODE: ContextVar[ProvenanceMode] = ContextVar('provenance_mode', default=ProvenanceMode.FULL)
+
+REFERENCE_KEYS = ('file_origin', 'file_row')
+
+
+def provenance_data(record: Dict[str, Any]) -> Dict[str, Any]:
+    """The part of an input record the renamer keeps as `raw_data` in the current provenance mode."""
+    if PROVENANCE_MODE.get() is ProvenanceMode.FULL:
+        return record.copy()
+    return {k: record[k] for k in REFERENCE_KEYS if k in record}
+
+
+def original_data(raw_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The part of `raw_data` stored as `InputData.original_data` in the current provenance mode."""
+    return None if PROVENANCE_MODE.get() is ProvenanceMode.NONE else raw_data
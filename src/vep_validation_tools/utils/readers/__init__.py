@@ -1 +1,6 @@
-from .toml_reader import TomlReader
\ No newline at end of file
+from .toml_reader import TomlReader
+from .state_config import StateConfig, load_state_config
+from .delimited_reader import DelimitedReader, ZipArchiveReader
+from .fixed_width_reader import FixedWidthReader
+from .partitioned_source import PartitionedSource
+from .parquet_reader import ParquetReader
@@ -0,0 +1,130 @@
+from __future__ import annotations
+import fnmatch
+import zipfile
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import IO, Any, Dict, FrozenSet, Generator, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .state_config import load_state_config
+from ..renamer_funcs import normalize_blank_frame
+
+
+@dataclass
+class DelimitedReader:
+    """
+    Streams records from a delimited voterfile in fixed-size chunks, for `CreateValidator.run_validation`.
+
+    Only the columns referenced by the state's TOML `FIELDS` mapping are parsed, every value is read as a
+    string (blanks stay as ""), and each record is tagged with `file_origin` and its zero-based `file_row`.
+    Memory stays constant whatever the size of the file. Gzip, bz2, xz and zstd files are decompressed as
+    they are streamed.
+
+    Attributes:
+        file (Path): The path to the delimited file.
+        field_path (Path): The path to the state's TOML field mapping.
+        delimiter (str): The field delimiter. Defaults to ",".
+        encoding (str): The file encoding. Defaults to "utf-8".
+        chunk_size (int): The number of rows parsed at a time. Defaults to 10,000.
+        file_origin (Optional[str]): The value tagged onto each record. Defaults to the file name.
+        columns (Optional[Iterable[str]]): Overrides the columns read from the TOML mapping.
+        compression (Optional[str]): The compression of the file. Defaults to "infer", from its extension.
+        normalize (bool): Clear blank values and strip whitespace column-wise per chunk, so the renamer can skip
+            it per record. `original_data` then holds the normalized values. Defaults to False.
+    """
+    file: Path
+    field_path: Path
+    delimiter: str = ","
+    encoding: str = "utf-8"
+    chunk_size: int = 10_000
+    file_origin: Optional[str] = None
+    columns: Optional[Iterable[str]] = None
+    compression: Optional[str] = "infer"
+    normalize: bool = False
+    _columns: FrozenSet[str] = field(default=frozenset(), init=False)
+
+    def __post_init__(self):
+        self.file = Path(self.file)
+        if self.file_origin is None:
+            self.file_origin = self.file.name
+        if self.columns is not None:
+            self._columns = frozenset(self.columns)
+        else:
+            self._columns = load_state_config(self.field_path).mapped_columns
+
+    def __iter__(self):
+        return self.records()
+
+    def _read(
+            self,
+            source: Union[Path, IO[bytes]],
+            compression: Optional[str]) -> Generator[pd.DataFrame, None, None]:
+        with pd.read_csv(
+                source,
+                compression=compression,
+                sep=self.delimiter,
+                encoding=self.encoding,
+                usecols=lambda column: column in self._columns,
+                dtype=str,
+                keep_default_na=False,
+                na_filter=False,
+                chunksize=self.chunk_size) as _chunks:
+            yield from _chunks
+
+    def _batches(
+            self,
+            source: Union[Path, IO[bytes]],
+            file_origin: str,
+            compression: Optional[str]) -> Generator[List[Dict[str, Any]], None, None]:
+        _row = 0
+        for _chunk in self._read(source, compression):
+            if self.normalize:
+                normalize_blank_frame(_chunk)
+            _chunk['file_origin'] = file_origin
+            _chunk['file_row'] = range(_row, _row + len(_chunk))
+            _row += len(_chunk)
+            yield _chunk.to_dict('records')
+
+    def batches(self) -> Generator[List[Dict[str, Any]], None, None]:
+        yield from self._batches(self.file, self.file_origin, self.compression)
+
+    def records(self) -> Generator[Dict[str, Any], None, None]:
+        for _batch in self.batches():
+            yield from _batch
+
+
+@dataclass
+class ZipArchiveReader(DelimitedReader):
+    """
+    Streams records from every delimited file inside a zip archive, such as one file per county, without
+    extracting the archive to disk.
+
+    Each member is tagged with its own name as `file_origin`, with `file_row` counted within the member. The
+    reader is a `PartitionedSource`, so in parallel runs each member is streamed and validated by a separate
+    worker process, which sends the results back one chunk at a time rather than one batch per member.
+
+    Attributes:
+        pattern (str): Only members whose names match this glob are read. Defaults to every file.
+        members (Optional[Tuple[str, ...]]): Restricts the reader to these members, in this order.
+    """
+    pattern: str = "*"
+    members: Optional[Tuple[str, ...]] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.members is None:
+            with zipfile.ZipFile(self.file) as zf:
+                self.members = tuple(
+                    x.filename for x in zf.infolist() if not x.is_dir() and fnmatch.fnmatch(x.filename, self.pattern)
+                )
+
+    def partitions(self) -> Sequence[ZipArchiveReader]:
+        """One reader per archive member."""
+        return [replace(self, members=(x,)) for x in self.members]
+
+    def batches(self) -> Generator[List[Dict[str, Any]], None, None]:
+        with zipfile.ZipFile(self.file) as zf:
+            for _member in self.members:
+                with zf.open(_member) as f:
+                    yield from self._batches(f, _member, None)
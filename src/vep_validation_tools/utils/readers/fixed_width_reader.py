@@ -0,0 +1,93 @@
+from __future__ import annotations
+import mmap
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+from .state_config import FieldOffsets, load_state_config
+from ..renamer_funcs import BLANK_VALUES
+
+
+@dataclass
+class FixedWidthReader:
+    """
+    Streams records from a fixed-width voterfile without converting it to CSV first.
+
+    The file is memory-mapped and each record is sliced by the offsets in the state TOML's `FIXED-WIDTH`
+    section. Only the columns the `FIELDS` mapping references are decoded; values are stripped of padding,
+    so blank fields read as "". Records are newline-terminated unless `record_length` is given, and are tagged
+    with `file_origin` and their zero-based `file_row`.
+
+    Attributes:
+        file (Path): The path to the fixed-width file.
+        field_path (Path): The path to the state's TOML field mapping and layout.
+        encoding (str): The file encoding. Defaults to "utf-8".
+        chunk_size (int): The number of records per batch. Defaults to 10,000.
+        file_origin (Optional[str]): The value tagged onto each record. Defaults to the file name.
+        record_length (Optional[int]): The length in bytes of each record, for files without line breaks.
+        normalize (bool): Clear blank values and strip whitespace column-wise per chunk, so the renamer can skip
+            it per record. `original_data` then holds the normalized values. Defaults to False.
+    """
+    file: Path
+    field_path: Path
+    encoding: str = "utf-8"
+    chunk_size: int = 10_000
+    file_origin: Optional[str] = None
+    record_length: Optional[int] = None
+    normalize: bool = False
+    _offsets: FieldOffsets = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        self.file = Path(self.file)
+        if self.file_origin is None:
+            self.file_origin = self.file.name
+        _config = load_state_config(self.field_path)
+        if not _config.fixed_width:
+            raise ValueError(f"{self.field_path} has no FIXED-WIDTH section")
+        self._offsets = {k: v for k, v in _config.fixed_width.items() if k in _config.mapped_columns}
+
+    def __iter__(self):
+        return self.records()
+
+    def _spans(self, mm: mmap.mmap) -> Generator[Tuple[int, int], None, None]:
+        _size, _pos = len(mm), 0
+        if self.record_length:
+            while _pos < _size:
+                yield _pos, min(_pos + self.record_length, _size)
+                _pos += self.record_length
+            return
+        while _pos < _size:
+            _end = mm.find(b"\n", _pos)
+            if _end == -1:
+                _end = _size
+            _line_end = _end - 1 if _end > _pos and mm[_end - 1] == 0x0D else _end
+            if _line_end > _pos:
+                yield _pos, _line_end
+            _pos = _end + 1
+
+    def records(self) -> Generator[Dict[str, Any], None, None]:
+        if self.file.stat().st_size == 0:
+            return
+        _offsets = tuple(self._offsets.items())
+        _encoding, _file_origin = self.encoding, self.file_origin
+        with open(self.file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for _row, (_start, _stop) in enumerate(self._spans(mm)):
+                _record = {
+                    column: str(mm[min(_start + start, _stop):min(_start + end, _stop)], _encoding).strip()
+                    for column, (start, end) in _offsets
+                }
+                if self.normalize:
+                    _record = {k: None if v in BLANK_VALUES else v for k, v in _record.items()}
+                _record['file_origin'] = _file_origin
+                _record['file_row'] = _row
+                yield _record
+
+    def batches(self) -> Generator[List[Dict[str, Any]], None, None]:
+        _batch = []
+        for _record in self.records():
+            _batch.append(_record)
+            if len(_batch) >= self.chunk_size:
+                yield _batch
+                _batch = []
+        if _batch:
+            yield _batch
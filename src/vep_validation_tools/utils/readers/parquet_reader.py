@@ -0,0 +1,123 @@
+from __future__ import annotations
+import itertools
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple
+
+from .state_config import load_state_config
+from ..renamer_funcs import BLANK_VALUES
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet files requires pyarrow. Install it with `pip install vep-validation-tools[parquet]`."
+        ) from e
+    return pyarrow
+
+
+@dataclass
+class ParquetReader:
+    """
+    Streams records from a Parquet file batch by batch, projecting only the columns referenced by the
+    state's TOML `FIELDS` mapping.
+
+    Values are cast to strings, as the renaming models expect, with nulls read as None, and each record is
+    tagged with `file_origin` and its zero-based `file_row`. The reader is a
+    `PartitionedSource`: in parallel runs each worker process opens the file, reads its own row group and sends
+    the results back one chunk at a time.
+
+    Attributes:
+        file (Path): The path to the Parquet file.
+        field_path (Path): The path to the state's TOML field mapping.
+        batch_size (int): The maximum number of rows per record batch. Defaults to 10,000.
+        file_origin (Optional[str]): The value tagged onto each record. Defaults to the file name.
+        row_groups (Optional[Tuple[int, ...]]): Restricts the reader to these row groups.
+        normalize (bool): Clear blank values and strip whitespace column-wise per chunk, so the renamer can skip
+            it per record. `original_data` then holds the normalized values. Defaults to False.
+    """
+    file: Path
+    field_path: Path
+    batch_size: int = 10_000
+    file_origin: Optional[str] = None
+    row_groups: Optional[Tuple[int, ...]] = None
+    normalize: bool = False
+    _columns: List[str] = field(default_factory=list, init=False)
+    _num_row_groups: int = field(default=0, init=False)
+    _row_group_offsets: List[int] = field(default_factory=list, init=False)
+
+    def __post_init__(self):
+        pa = _import_pyarrow()
+        self.file = Path(self.file)
+        if self.file_origin is None:
+            self.file_origin = self.file.name
+        _mapped = load_state_config(self.field_path).mapped_columns
+        _metadata = pa.parquet.read_metadata(self.file)
+        self._columns = [x for x in _metadata.schema.names if x in _mapped]
+        self._num_row_groups = _metadata.num_row_groups
+        self._row_group_offsets = list(
+            itertools.accumulate((_metadata.row_group(i).num_rows for i in range(self._num_row_groups)), initial=0)
+        )
+
+    def __iter__(self):
+        return self.records()
+
+    @property
+    def num_row_groups(self) -> int:
+        return self._num_row_groups
+
+    def _row_groups(self) -> Sequence[int]:
+        return self.row_groups if self.row_groups is not None else range(self._num_row_groups)
+
+    def partitions(self) -> Sequence[ParquetReader]:
+        """One reader per row group, in file order."""
+        return [replace(self, row_groups=(i,)) for i in self._row_groups()]
+
+    def _record_batches(self) -> Generator[Tuple[int, Any], None, None]:
+        pa = _import_pyarrow()
+        _file = pa.parquet.ParquetFile(self.file)
+        # Row groups are read one at a time, so every batch starts at a known row of the file.
+        for _row_group in self._row_groups():
+            _row = self._row_group_offsets[_row_group]
+            for _batch in _file.iter_batches(
+                    batch_size=self.batch_size,
+                    row_groups=[_row_group],
+                    columns=self._columns):
+                _columns = [
+                    column if pa.types.is_string(column.type) else pa.compute.cast(column, pa.string())
+                    for column in _batch.columns
+                ]
+                if self.normalize:
+                    _columns = [self._normalize(pa, column) for column in _columns]
+                yield _row, pa.RecordBatch.from_arrays(_columns, names=_batch.schema.names)
+                _row += _batch.num_rows
+
+    @staticmethod
+    def _normalize(pa, column):
+        # Blank values become null first, then the remaining strings are stripped, as the renamer does.
+        return pa.compute.if_else(
+            pa.compute.is_in(column, value_set=pa.array(BLANK_VALUES)),
+            pa.scalar(None, pa.string()),
+            pa.compute.utf8_trim_whitespace(column)
+        )
+
+    def record_batches(self) -> Generator[Any, None, None]:
+        """Yields `pyarrow.RecordBatch`es of the mapped columns, cast to strings."""
+        for _, _batch in self._record_batches():
+            yield _batch
+
+    def batches(self) -> Generator[List[Dict[str, Any]], None, None]:
+        for _row, _batch in self._record_batches():
+            _records = _batch.to_pylist()
+            for i, _record in enumerate(_records, _row):
+                _record['file_origin'] = self.file_origin
+                _record['file_row'] = i
+            yield _records
+
+    def records(self) -> Generator[Dict[str, Any], None, None]:
+        for _batch in self.batches():
+            yield from _batch
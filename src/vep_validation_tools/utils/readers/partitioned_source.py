@@ -0,0 +1,17 @@
+from typing import Any, Dict, Iterable, Iterator, Protocol, Sequence, runtime_checkable
+
+
+@runtime_checkable
+class PartitionedSource(Protocol):
+    """
+    A record source that can be split into independent, picklable partitions (row groups, archive members).
+
+    `CreateValidator.run_validation` hands each partition to a worker process, which reads its own records
+    directly instead of receiving them pickled from the parent.
+    """
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        ...
+
+    def partitions(self) -> Sequence[Iterable[Dict[str, Any]]]:
+        ...
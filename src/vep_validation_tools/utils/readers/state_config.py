@@ -0,0 +1,146 @@
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from .toml_reader import TomlReader
+
+FieldOffsets = Dict[str, Tuple[int, int]]
+
+CONFIG_CACHE_DIR_ENV = "VEP_CONFIG_CACHE_DIR"
+
+_STATE_CONFIGS: Dict[str, StateConfig] = {}
+
+
+def mapped_columns(fields: Dict[str, Any]) -> FrozenSet[str]:
+    """Returns every input column referenced by a state's TOML `FIELDS` mapping."""
+    _columns = set()
+    for k, v in fields.items():
+        if v is None or v == "null":
+            _columns.add(k)
+        elif isinstance(v, list):
+            _columns.update(x for x in v if x and x != "null")
+        else:
+            _columns.add(v)
+    return frozenset(_columns)
+
+
+def fixed_width_layout(layout: Optional[Dict[str, Any]]) -> Optional[FieldOffsets]:
+    """
+    Parses the `FIXED-WIDTH` section of a state TOML, which maps each input column to its zero-based
+    `[start, end]` byte offsets within a record (end exclusive), e.g. `VUID = [0, 10]`.
+    """
+    if layout is None:
+        return None
+    _offsets = {}
+    for column, offsets in layout.items():
+        if not (isinstance(offsets, list) and len(offsets) == 2 and all(isinstance(x, int) for x in offsets)):
+            raise ValueError(f"FIXED-WIDTH offsets for {column} must be [start, end], got {offsets!r}")
+        start, end = offsets
+        if not 0 <= start < end:
+            raise ValueError(f"FIXED-WIDTH offsets for {column} must satisfy 0 <= start < end, got {offsets!r}")
+        _offsets[column] = (start, end)
+    return _offsets
+
+
+@dataclass(frozen=True)
+class StateConfig:
+    """
+    A state TOML compiled once, with "null" values already replaced by None.
+
+    Treat the contents as read-only: the same instance is shared by every caller that loads the file.
+
+    Attributes:
+        path (Path): The resolved path to the TOML file.
+        mtime_ns (int): The modification time of the file when it was compiled.
+        digest (str): A hash of the file contents, stable across processes and machines.
+        data (Dict[str, Any]): The whole normalized TOML document.
+        settings (Dict[str, Any]): The `SETTINGS` table.
+        field_formatting (Optional[Dict[str, Any]]): `SETTINGS.FIELD-FORMATTING`.
+        voter_id_lengths (Optional[Dict[str, Any]]): `SETTINGS.VOTER-ID`.
+        replace_chars (Optional[Dict[str, Any]]): `SETTINGS.REPLACE-CHARS`.
+        fields (Dict[str, Any]): The `FIELDS` mapping.
+        fixed_width (Optional[FieldOffsets]): The parsed `FIXED-WIDTH` layout, if any.
+        mapped_columns (FrozenSet[str]): Every input column the `FIELDS` mapping references.
+    """
+    path: Path
+    mtime_ns: int
+    digest: str
+    data: Dict[str, Any]
+    settings: Dict[str, Any]
+    field_formatting: Optional[Dict[str, Any]]
+    voter_id_lengths: Optional[Dict[str, Any]]
+    replace_chars: Optional[Dict[str, Any]]
+    fields: Dict[str, Any]
+    fixed_width: Optional[FieldOffsets]
+    mapped_columns: FrozenSet[str]
+
+    @classmethod
+    def compile(cls, path: Path, mtime_ns: int) -> StateConfig:
+        _data = TomlReader(file=path).data
+        _settings = _data.get('SETTINGS') or {}
+        _fields = _data.get('FIELDS') or {}
+        return cls(
+            path=path,
+            mtime_ns=mtime_ns,
+            digest=hashlib.blake2b(path.read_bytes(), digest_size=8).hexdigest(),
+            data=_data,
+            settings=_settings,
+            field_formatting=_settings.get('FIELD-FORMATTING'),
+            voter_id_lengths=_settings.get('VOTER-ID'),
+            replace_chars=_settings.get('REPLACE-CHARS'),
+            fields=_fields,
+            fixed_width=fixed_width_layout(_data.get('FIXED-WIDTH')),
+            mapped_columns=mapped_columns(_fields),
+        )
+
+
+def _cache_file(cache_dir: Path, path: Path) -> Path:
+    _path_hash = hashlib.blake2b(str(path).encode('utf-8'), digest_size=8).hexdigest()
+    return Path(cache_dir) / f"{path.stem}-{_path_hash}.config.pickle"
+
+
+def _load_cached(cache_file: Path, mtime_ns: int) -> Optional[StateConfig]:
+    try:
+        with open(cache_file, "rb") as f:
+            config = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if isinstance(config, StateConfig) and config.mtime_ns == mtime_ns:
+        return config
+    return None
+
+
+def _save_cached(cache_file: Path, config: StateConfig) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    _tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    with open(_tmp_path, "wb") as f:
+        pickle.dump(config, f)
+    os.replace(_tmp_path, cache_file)
+
+
+def load_state_config(path: Path, cache_dir: Optional[Path] = None) -> StateConfig:
+    """
+    Returns the compiled config for a state TOML, parsing the file only when it has changed.
+
+    Configs are cached in memory per (path, mtime). With `cache_dir`, or the `VEP_CONFIG_CACHE_DIR`
+    environment variable, they are also pickled to disk, so freshly spawned worker processes skip parsing.
+    """
+    path = Path(path).resolve()
+    _mtime_ns = path.stat().st_mtime_ns
+    _key = str(path)
+    if (config := _STATE_CONFIGS.get(_key)) is not None and config.mtime_ns == _mtime_ns:
+        return config
+
+    cache_dir = cache_dir or os.environ.get(CONFIG_CACHE_DIR_ENV)
+    _cached = _cache_file(Path(cache_dir), path) if cache_dir else None
+    config = _load_cached(_cached, _mtime_ns) if _cached else None
+    if config is None:
+        config = StateConfig.compile(path, _mtime_ns)
+        if _cached:
+            _save_cached(_cached, config)
+    _STATE_CONFIGS[_key] = config
+    return config
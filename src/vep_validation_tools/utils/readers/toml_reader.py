@@ -15,7 +15,7 @@ class TomlReader:
         _data (Dict, optional): The data from the TOML file. Defaults to None.
 
     Properties:
-        data (Dict): Returns the data from the TOML file. Can also set the data.
+        data (Dict): Returns the data from the TOML file, reading it on first access. Can also set the data.
 
     Methods:
         replace_null_with_none(data): Replaces all instances of "null" in the data with None.
@@ -29,8 +29,9 @@ class TomlReader:
 
     @property
     def data(self) -> Dict:
-        with open(self.file, "rb") as f:
-            self._data = tomli.load(f)
+        if self._data is None:
+            with open(self.file, "rb") as f:
+                self._data = tomli.load(f)
         return self._data
 
     @data.setter
@@ -1,14 +1,42 @@
-from typing import Dict, Any
+from contextvars import ContextVar
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import pandas as pd
 from pydantic import BaseModel
 from pydantic_core import PydanticCustomError
 
+from .provenance import provenance_data
+
+# Raw values the renamer, the readers and the prefilter all read as missing.
+BLANK_VALUES = ("", '"', "null")
+
+# Set while validating records whose blanks were already cleared column-wise by `normalize_blank_frame`.
+BLANKS_NORMALIZED: ContextVar[bool] = ContextVar('blanks_normalized', default=False)
+
+
+def normalize_blank_frame(frame: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Applies `clear_blank_strings` and whitespace stripping column-wise to a chunk of string columns, in the same
+    order as the renamer: exact blank values become None, then the remaining strings are stripped.
+    """
+    for column in (frame.columns if columns is None else columns):
+        _values = frame[column]
+        frame[column] = _values.str.strip().astype(object).where(~_values.isin(BLANK_VALUES), None)
+    return frame
+
 
 def create_raw_data_dict(cls, values) -> Dict[str, Any]:
-    _raw_values = values.copy()
+    _raw_values = provenance_data(values)
     values['raw_data'] = _raw_values
     return values
 
 
+def prefix_index(cls: type, prefixes: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    """Maps each prefix to the sorted attribute names of `cls` and its model fields that start with it."""
+    _names = sorted(set(dir(cls)) | set(getattr(cls, 'model_fields', {})))
+    return {pfx: tuple(x for x in _names if x.startswith(pfx)) for pfx in prefixes}
+
+
 def clear_blank_strings(cls, values) -> Dict[str, Any]:
     """
     Clear out all blank strings or ones that contain 'null' from records.
@@ -16,17 +44,18 @@ def clear_blank_strings(cls, values) -> Dict[str, Any]:
     :param values:
     :return:
     """
+    if BLANKS_NORMALIZED.get():
+        return values
     for k, v in values.items():
-        if v in ["", '"', "null"]:
+        if v in BLANK_VALUES:
             values[k] = None
-        if k in ["", '"', "null"]:
+        if k in BLANK_VALUES:
             values[k] = values[k].replace(k, None)
     return values
 
 
-def check_address_has_state(self: BaseModel):
-    if not (_state := self.settings.get('STATE')):
-        raise ValueError("State must be provided in the settings.")
+def missing_address_states(_data: Dict[str, Any], _abbreviation: str) -> List[Tuple[str, str]]:
+    """The `(field, abbreviation)` pairs to set for address types in `_data` that have no state."""
     def _search(t: str) -> dict | None:
         return {k: v for k, v in _data.items() if k.startswith(t)}
 
@@ -39,9 +68,12 @@ def check_address_has_state(self: BaseModel):
                 return (f"{_type}_state", _abbreviation)
         return
 
-    _data = self.model_dump(exclude_none=True)
-    _abbreviation = _state['abbreviation']
-    for _type in [_search('residence'), _search('mail')]:
-        if _state := _has_state(_type):
-            setattr(self, *_state)
+    return [_state for _type in [_search('residence'), _search('mail')] if (_state := _has_state(_type))]
+
+
+def check_address_has_state(self: BaseModel):
+    if not (_state := self.settings.get('STATE')):
+        raise ValueError("State must be provided in the settings.")
+    for _field in missing_address_states(self.model_dump(exclude_none=True), _state['abbreviation']):
+        setattr(self, *_field)
     return self
\ No newline at end of file
@@ -0,0 +1,201 @@
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+import shutil
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, Generator, Iterable, List, Optional, Sequence, Tuple
+
+from election_utils.election_models import ElectionList
+
+from .error_aggregator import ErrorAggregator
+from .readers import PartitionedSource
+
+Shard = Tuple[int, int]
+
+
+def check_shard(shard: Shard) -> Shard:
+    index, count = shard
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {shard}: expected (index, count) with 0 <= index < count")
+    return index, count
+
+
+def shard_for_record(record: Dict[str, Any], row: int | str, shard_count: int, id_columns: Sequence[str]) -> int:
+    """
+    Returns the shard a raw record belongs to, from a stable hash of its voter id. Records without a
+    voter id fall back to their row number, so every node running over the same file agrees.
+    """
+    _key = next((f"id:{record[column]}" for column in id_columns if record.get(column)), f"row:{row}")
+    _digest = hashlib.blake2b(_key.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(_digest, 'big') % shard_count
+
+
+def filter_shard(
+        records: Iterable[Dict[str, Any]],
+        shard: Shard,
+        id_columns: Sequence[str],
+        partition: Optional[int] = None) -> Generator[Dict[str, Any], None, None]:
+    index, count = check_shard(shard)
+    for row, record in enumerate(records):
+        _row = row if partition is None else f"{partition}:{row}"
+        if shard_for_record(record, _row, count, id_columns) == index:
+            yield record
+
+
+@dataclass
+class ShardedPartition:
+    """One partition of a `ShardedSource`, filtered by the worker that reads it."""
+    partition: Iterable[Dict[str, Any]]
+    index: int
+    shard: Shard
+    id_columns: Sequence[str]
+
+    def __iter__(self):
+        return filter_shard(self.partition, self.shard, self.id_columns, self.index)
+
+
+@dataclass
+class ShardedSource:
+    """
+    A `PartitionedSource` narrowed to one shard. It stays partitioned, so parallel runs still read and filter
+    each partition in a worker. Records without a voter id are keyed by their partition and their row within
+    it, which every node agrees on whether it reads the source serially or in parallel.
+    """
+    source: PartitionedSource
+    shard: Shard
+    id_columns: Sequence[str]
+
+    def __iter__(self):
+        for partition in self.partitions():
+            yield from partition
+
+    def partitions(self) -> Sequence[ShardedPartition]:
+        return [ShardedPartition(x, i, self.shard, self.id_columns) for i, x in enumerate(self.source.partitions())]
+
+
+def shard_records(
+        records: Iterable[Dict[str, Any]],
+        shard: Shard,
+        id_columns: Sequence[str]) -> Iterable[Dict[str, Any]]:
+    """The records of `shard`, as a `ShardedSource` when `records` is a `PartitionedSource`."""
+    if isinstance(records, PartitionedSource):
+        return ShardedSource(records, check_shard(shard), list(id_columns))
+    return filter_shard(records, shard, id_columns)
+
+
+def write_election_vote(file: IO[bytes], election: Any, vote_method: Any, vote_record: Any) -> None:
+    pickle.dump((election, vote_method, vote_record), file)
+
+
+def read_election_votes(path: Path) -> Generator[Tuple[Any, Any, Any], None, None]:
+    """Streams the `(election, vote_method, vote_record)` tuples written by `write_election_vote`."""
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+@dataclass
+class ShardResult:
+    """
+    The outcome of validating one shard of a file.
+
+    Attributes:
+        shard (Shard): The `(index, count)` of the shard.
+        valid_count (int): The number of valid records.
+        invalid_count (int): The number of invalid records.
+        error_summary (Dict[str, int]): Error counts by error type.
+        error_aggregator (Optional[ErrorAggregator]): The shard's error counts and samples.
+        elections (Optional[Any]): The `ElectionList` accumulated for the shard.
+        election_votes (Optional[Path]): The file every `(election, vote_method, vote_record)` added to
+            `elections` was written to, in order.
+        outputs (List[Path]): Files written for the shard.
+    """
+    shard: Shard
+    valid_count: int = 0
+    invalid_count: int = 0
+    error_summary: Dict[str, int] = field(default_factory=dict)
+    error_aggregator: Optional[ErrorAggregator] = None
+    elections: Optional[Any] = None
+    election_votes: Optional[Path] = None
+    outputs: List[Path] = field(default_factory=list)
+
+
+def _merge_elections(results: Sequence[ShardResult]) -> Optional[ElectionList]:
+    if all(r.elections is None for r in results):
+        return None
+    merged = ElectionList()
+    for result in results:
+        if result.elections is not None and result.election_votes is None:
+            raise ValueError(
+                f"Shard {result.shard} has elections but no votes to merge; "
+                "load it with `CreateRecords(election_votes_path=...)`"
+            )
+        if result.election_votes is None:
+            continue
+        # Replaying every vote through `add_or_update_election` builds the list exactly as a single run does.
+        # Votes are streamed from each shard's file, so only the merged list is held in memory.
+        for election, vote_method, vote_record in read_election_votes(result.election_votes):
+            merged.add_or_update_election(election=election, vote_method=vote_method, vote_record=vote_record)
+    return merged
+
+
+def _merge_errors(results: Sequence[ShardResult]) -> Tuple[Optional[ErrorAggregator], Dict[str, int]]:
+    if any(r.error_aggregator is None for r in results):
+        error_summary = Counter()
+        for result in results:
+            error_summary.update(result.error_summary)
+        return None, dict(error_summary)
+    merged = ErrorAggregator(sample_size=results[0].error_aggregator.sample_size)
+    for result in results:
+        merged.merge(result.error_aggregator)
+    return merged, merged.summary()
+
+
+def _concatenate_outputs(paths: Iterable[Path], output: Path) -> None:
+    output = Path(output)
+    _tmp_path = output.with_name(f"{output.name}.tmp")
+    with open(_tmp_path, "wb") as f:
+        for path in paths:
+            with open(path, "rb") as src:
+                shutil.copyfileobj(src, f)
+    os.replace(_tmp_path, output)
+
+
+def merge_shard_results(results: Iterable[ShardResult], output: Optional[Path] = None) -> ShardResult:
+    """
+    Combines the results of every shard of a run into one result, as if the file had been validated on a
+    single node.
+
+    Counters are summed, error aggregators are merged with `ErrorAggregator.merge`, and the shards' election
+    vote files are streamed into a new `ElectionList`; the merged result has no vote file of its own. With
+    `output`, the shards' output files are concatenated into it in shard order, which suits line-oriented
+    outputs such as JSON lines; records are then grouped by shard rather than in input order. Without it,
+    `outputs` lists the shard files in shard order.
+    """
+    _results = sorted(results, key=lambda r: r.shard[0])
+    if not _results:
+        raise ValueError("No shard results to merge")
+    _count = _results[0].shard[1]
+    if [r.shard for r in _results] != [(i, _count) for i in range(_count)]:
+        raise ValueError(f"Expected exactly one result for each of {_count} shards")
+
+    _aggregator, _error_summary = _merge_errors(_results)
+    _outputs = [x for r in _results for x in r.outputs]
+    if output is not None:
+        _concatenate_outputs(_outputs, output)
+        _outputs = [Path(output)]
+    return ShardResult(
+        shard=(0, 1),
+        valid_count=sum(r.valid_count for r in _results),
+        invalid_count=sum(r.invalid_count for r in _results),
+        error_summary=_error_summary,
+        error_aggregator=_aggregator,
+        elections=_merge_elections(_results),
+        outputs=_outputs
+    )
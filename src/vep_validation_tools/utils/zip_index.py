@@ -0,0 +1,145 @@
+from __future__ import annotations
+import json
+import mmap
+import os
+import struct
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import pandas as pd
+
+ZIP_INDEX_ENV = "VEP_ZIP_INDEX"
+
+ZIP_INDEX_MAGIC = b"VEPZIP\x00\x01"
+
+# magic, number of strings, offset of the string table
+_HEADER = struct.Struct("<8sII")
+
+# city, state and county ids into the string table, 0 when unknown
+_SLOT = struct.Struct("<3I")
+
+_ZIP5_SLOTS = 100_000
+
+_ZIP_INDEXES: Dict[str, ZipIndex] = {}
+
+
+class ZipEntry(NamedTuple):
+    city: Optional[str]
+    state: Optional[str]
+    county: Optional[str]
+
+
+def _zip5(value: Any) -> Optional[str]:
+    _value = str(value).strip().split('-')[0]
+    if not _value.isdigit() or len(_value) > 5:
+        return None
+    return _value.zfill(5)
+
+
+@dataclass
+class ZipIndex:
+    """
+    A read-only ZIP5 -> canonical city, state and county index, memory-mapped from a file written by `build`.
+
+    The file holds one fixed-size slot per possible zip5, so a lookup is a single offset read, followed by a
+    table of the distinct city, state and county names. Open it with `load_zip_index`, which maps each file
+    once per process; pickled copies reopen the file by path.
+
+    Attributes:
+        path (Path): The index file.
+    """
+    path: Path
+    _mm: Optional[mmap.mmap] = field(default=None, init=False, repr=False)
+    _strings: List[Optional[str]] = field(default_factory=list, init=False, repr=False)
+    _mtime_ns: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self):
+        self.path = Path(self.path)
+        with open(self.path, "rb") as f:
+            self._mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _magic, _count, _offset = _HEADER.unpack_from(self._mm, 0)
+        if _magic != ZIP_INDEX_MAGIC:
+            raise ValueError(f"{self.path} is not a zip index")
+        self._strings = [None] + json.loads(self._mm[_offset:].decode('utf-8'))
+        if len(self._strings) != _count + 1:
+            raise ValueError(f"{self.path} has a truncated string table")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'path': self.path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(load_zip_index(state['path']).__dict__)
+
+    def get(self, zip5: Optional[str]) -> Optional[ZipEntry]:
+        if not zip5 or len(zip5) != 5 or not zip5.isdigit():
+            return None
+        _ids = _SLOT.unpack_from(self._mm, _HEADER.size + int(zip5) * _SLOT.size)
+        if not any(_ids):
+            return None
+        return ZipEntry(*(self._strings[i] for i in _ids))
+
+    @classmethod
+    def build(
+            cls,
+            source: Path,
+            target: Path,
+            zip_column: str = 'zip',
+            city_column: str = 'city',
+            state_column: str = 'state',
+            county_column: str = 'county') -> ZipIndex:
+        """
+        Writes an index from a delimited reference file with one row per zipcode, and returns it opened.
+
+        Zipcodes may carry a +4 suffix or have lost their leading zeros. Names are upper-cased, and the first row
+        for a zipcode wins, so list the preferred city first when a zipcode has several.
+        """
+        _columns = [zip_column, city_column, state_column, county_column]
+        _frame = pd.read_csv(source, sep=None, engine='python', dtype=str, keep_default_na=False, usecols=_columns)
+        _ids: Dict[str, int] = {}
+        _slots = bytearray(_ZIP5_SLOTS * _SLOT.size)
+        _seen = set()
+        for _zip, *_values in _frame[_columns].itertuples(index=False):
+            if (_zip := _zip5(_zip)) is None or _zip in _seen:
+                continue
+            _seen.add(_zip)
+            _slot = []
+            for _value in _values:
+                _value = " ".join(_value.upper().split())
+                _slot.append(_ids.setdefault(_value, len(_ids) + 1) if _value else 0)
+            _SLOT.pack_into(_slots, int(_zip) * _SLOT.size, *_slot)
+
+        _strings = json.dumps(list(_ids)).encode('utf-8')
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        with open(_tmp_path, "wb") as f:
+            f.write(_HEADER.pack(ZIP_INDEX_MAGIC, len(_ids), _HEADER.size + len(_slots)))
+            f.write(_slots)
+            f.write(_strings)
+        os.replace(_tmp_path, target)
+        return load_zip_index(target)
+
+
+def load_zip_index(path: Path) -> ZipIndex:
+    """Returns the index at `path`, mapping the file only once per process and again when it changes."""
+    path = Path(path).resolve()
+    _mtime_ns = path.stat().st_mtime_ns
+    _key = str(path)
+    if (index := _ZIP_INDEXES.get(_key)) is not None and index._mtime_ns == _mtime_ns:
+        return index
+    index = _ZIP_INDEXES[_key] = ZipIndex(path)
+    return index
+
+
+def default_zip_index() -> Optional[ZipIndex]:
+    """The index named by the `VEP_ZIP_INDEX` environment variable, if set."""
+    if _path := os.environ.get(ZIP_INDEX_ENV):
+        return load_zip_index(Path(_path))
+    return None
+
+
+# The index consulted by `AddressValidationFuncs.complete_from_zip`, set per record by `CreateValidator`.
+ZIP_INDEX: ContextVar[Optional[ZipIndex]] = ContextVar('zip_index', default=None)
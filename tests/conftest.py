@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from vep_validation_tools.create_validator import CreateValidator
+from vep_validation_tools.pydantic_models.record import RecordBaseModel
+from vep_validation_tools.pydantic_models.rename_model import create_renamed_model
+
+TEXAS_FIELDS = """
+[SETTINGS]
+FILE-TYPE = "VOTERFILE"
+[SETTINGS.STATE]
+abbreviation = "TX"
+[SETTINGS.FIELD-FORMATTING]
+date = "%Y%m%d"
+[FIELDS]
+person_name_first = "FIRST"
+person_name_last = "LAST"
+residence_part_number = "NUM"
+residence_part_street_name = "STREET"
+residence_part_city = "CITY"
+residence_part_zip5 = "ZIP"
+voter_vuid = "VUID"
+mail_address1 = "MADDR"
+"""
+
+
+@pytest.fixture
+def field_path(tmp_path: Path) -> Path:
+    _path = tmp_path / "texas.toml"
+    _path.write_text(TEXAS_FIELDS)
+    return _path
+
+
+@pytest.fixture
+def validator(field_path: Path) -> CreateValidator:
+    return CreateValidator(
+        state_name=('texas', 'voterfile'),
+        renaming_validator=create_renamed_model('texas', field_path),
+        record_validator=RecordBaseModel,
+        field_path=field_path,
+        address_cache=None,
+        zip_index=None
+    )
@@ -0,0 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from vep_validation_tools.utils.address_cache import AddressCache
+
+
+def test_threads_share_the_lru_and_disk_tier(tmp_path):
+    cache = AddressCache(maxsize=8, path=tmp_path / "address_cache.sqlite", flush_every=5)
+
+    def _work(n: int) -> None:
+        for i in range(500):
+            _address = f"{(n * 7 + i) % 40} MAIN ST"
+            if cache.get(_address) is None:
+                cache.put(_address, {'address1': _address}, {'AddressNumber': _address.split()[0]})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_work, range(8)))
+    cache.close()
+
+    assert len(cache) <= 8
+    assert cache.hits + cache.misses == 8 * 500
+    cache.clear()
+    assert cache.get("3 MAIN ST") == ({'address1': "3 MAIN ST"}, {'AddressNumber': "3"})
@@ -0,0 +1,41 @@
+import pytest
+
+from vep_validation_tools.funcs.address_validation import AddressValidationFuncs
+
+
+CASES = [
+    {'number': '123', 'street_name': 'Main', 'street_type': 'St', 'city': 'St. Louis', 'state': 'MO', 'zip5': '63101'},
+    {'number': '123', 'street_name': 'Highway 71', 'city': 'Austin', 'state': 'TX', 'zip5': '78701'},
+    {'number': '123', 'street_name': 'County Road 12', 'city': 'Austin', 'state': 'TX', 'zip5': '78701'},
+    {'number': '12', 'street_name': 'Avenue B', 'city': 'Austin', 'state': 'TX', 'zip5': '78701'},
+    {'number': '12', 'street_name': "St. John's", 'street_type': 'Blvd', 'city': 'Austin', 'state': 'TX',
+     'zip5': '78701'},
+    {'number': '12', 'street_name': "O'Neil", 'street_type': 'Ave.', 'city': 'Austin', 'state': 'TX', 'zip5': '78701'},
+    {'number': '12', 'street_name': 'Main', 'street_type': 'St', 'city': 'Winston-Salem', 'state': 'NC',
+     'zip5': '27101'},
+]
+
+
+@pytest.mark.parametrize('parts', CASES, ids=lambda x: x['street_name'] + ', ' + x['city'])
+def test_part_columns_standardize_as_the_parser_does(parts: dict):
+    address = {f'residence_part_{k}': v for k, v in parts.items()}
+    parsed = AddressValidationFuncs.parse_address(AddressValidationFuncs.address_string(address, 'residence'))
+    from_columns = AddressValidationFuncs.standardize_address(address, 'residence')
+
+    assert from_columns['lines'] == parsed['lines']
+    assert from_columns['parts'].model_dump(exclude_none=True) == parsed['parts'].model_dump(exclude_none=True)
+
+
+def test_periods_are_dropped_from_part_columns():
+    address = {f'residence_part_{k}': v for k, v in CASES[0].items()}
+    result = AddressValidationFuncs.parts_from_columns(address, 'residence')
+
+    assert result is not None
+    assert result['lines'].city == 'ST LOUIS'
+
+
+@pytest.mark.parametrize('street_name', ['Highway 71', 'County Road 12', 'Avenue B'])
+def test_street_pre_types_are_left_to_the_parser(street_name: str):
+    address = {f'residence_part_{k}': v for k, v in {**CASES[1], 'street_name': street_name}.items()}
+
+    assert AddressValidationFuncs.parts_from_columns(address, 'residence') is None
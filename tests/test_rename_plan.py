@@ -0,0 +1,28 @@
+from unittest import mock
+
+from vep_validation_tools.create_validator import CreateValidator
+
+
+COLUMNS = ('FIRST', 'LAST', 'NUM', 'STREET', 'CITY', 'ZIP', 'VUID')
+
+
+def test_records_sharing_a_header_reuse_its_plan(validator: CreateValidator):
+    renamer = validator.renaming_validator
+    records = [dict(zip(COLUMNS, ('Ann', 'Lee', str(i), 'Main', 'Austin', '78701', str(i)))) for i in range(5)]
+
+    with mock.patch.object(renamer, 'plan', wraps=renamer.plan) as plan:
+        for record in records:
+            renamer._validate(record)
+    assert plan.call_count == 1
+
+
+def test_a_new_header_resolves_its_own_plan(validator: CreateValidator):
+    renamer = validator.renaming_validator
+    first = renamer._record_plan(dict.fromkeys(COLUMNS, ''))
+    # Equal keys built as new string objects still match the last header.
+    same = renamer._record_plan({''.join(x): '' for x in COLUMNS})
+    other = renamer._record_plan(dict.fromkeys(COLUMNS[:-1], ''))
+
+    assert same is first
+    assert other is not first
+    assert other.columns == COLUMNS[:-1]
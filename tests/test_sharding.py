@@ -0,0 +1,60 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from vep_validation_tools.create_validator import CreateRecords, CreateValidator
+from vep_validation_tools.utils import sharding
+from vep_validation_tools.utils.readers import ParquetReader, PartitionedSource
+from vep_validation_tools.utils.sharding import ShardResult, merge_shard_results, read_election_votes
+
+
+def _records(n: int):
+    for i in range(n):
+        yield {'FIRST': f'Ann{i}', 'LAST': 'Lee', 'NUM': str(100 + i), 'STREET': 'Main', 'CITY': 'Austin',
+               'ZIP': '78701', 'VUID': '' if i % 7 == 0 else str(1000 + i)}
+
+
+@pytest.fixture
+def parquet_path(tmp_path: Path) -> Path:
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    _path = tmp_path / "texas.parquet"
+    pd.DataFrame(list(_records(90))).to_parquet(_path, row_group_size=30)
+    return _path
+
+
+def _shard_statuses(validator: CreateValidator, reader, shard, workers: int):
+    validator.run_validation(reader, shard=shard, workers=workers, chunk_size=10)
+    assert isinstance(validator._records, PartitionedSource)
+    return [status for status, _ in validator._validation_pipeline]
+
+
+def test_sharded_partitioned_source_is_validated_in_parallel(validator, field_path, parquet_path):
+    serial = [_shard_statuses(validator, ParquetReader(parquet_path, field_path), (i, 3), 1) for i in range(3)]
+    parallel = [_shard_statuses(validator, ParquetReader(parquet_path, field_path), (i, 3), 2) for i in range(3)]
+
+    assert parallel == serial
+    assert sum(len(x) for x in parallel) == 90
+
+
+def test_election_votes_are_streamed_from_each_shard_file(tmp_path: Path):
+    votes = [[('g2024', 'early', i) for i in range(3)], [('g2024', 'mail', i) for i in range(3, 5)]]
+    results = []
+    for i, shard_votes in enumerate(votes):
+        loader = CreateRecords(elections=mock.Mock(), election_votes_path=tmp_path / f"{i}.votes")
+        for vote in shard_votes:
+            loader._add_election_vote(*vote)
+        loader.close_election_votes()
+        results.append(ShardResult(shard=(i, 2), elections=loader.elections, election_votes=loader.election_votes_path))
+        assert list(read_election_votes(loader.election_votes_path)) == shard_votes
+
+    with mock.patch.object(sharding, 'ElectionList') as election_list:
+        merge_shard_results(results)
+    replayed = [tuple(x.kwargs.values()) for x in election_list.return_value.add_or_update_election.call_args_list]
+    assert replayed == votes[0] + votes[1]
+
+
+def test_merge_requires_a_vote_file_for_elections():
+    with pytest.raises(ValueError, match="election_votes_path"):
+        merge_shard_results([ShardResult(shard=(0, 1), elections=mock.Mock())])
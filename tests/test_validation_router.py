@@ -0,0 +1,33 @@
+import io
+import json
+
+from vep_validation_tools.create_validator import CreateValidator
+
+
+def test_invalid_record_with_value_error_is_written_to_file_sink(validator: CreateValidator):
+    # A mailing address without a state makes the renamer raise a ValueError, which pydantic keeps in `ctx`.
+    validator.run_validation([
+        {'FIRST': 'Ann', 'LAST': 'Lee', 'NUM': '1', 'STREET': 'Main', 'CITY': 'Austin', 'ZIP': '78701',
+         'VUID': '1', 'MADDR': '1 Main St'},
+    ])
+    sink = io.StringIO()
+    validator.add_sink('invalid', sink)
+    validator.route()
+
+    lines = sink.getvalue().splitlines()
+    assert len(lines) == 1
+    error = json.loads(lines[0])
+    assert error['point_of_failure'] == 'rename'
+    assert isinstance(error['errors'][0]['ctx']['error'], str)
+
+
+def test_binary_sink_receives_json_lines(validator: CreateValidator):
+    validator.run_validation([
+        {'FIRST': 'Ann', 'LAST': 'Lee', 'NUM': '1', 'STREET': 'Main', 'CITY': 'Austin', 'ZIP': '78701',
+         'VUID': '1', 'MADDR': '1 Main St'},
+    ])
+    sink = io.BytesIO()
+    validator.add_sink('invalid', sink)
+    validator.route()
+
+    assert json.loads(sink.getvalue().decode('utf-8'))['point_of_failure'] == 'rename'